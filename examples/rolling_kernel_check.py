@@ -0,0 +1,109 @@
+"""
+이동평균/표준편차 커널 회귀 점검
+
+yfinance 없이 가격이 일정한 구간이 섞인 랜덤 워크 데이터로
+ZScore / 평균 회귀 전략의 Signal이 pandas Series.rolling 기준 계산과
+같은지 확인합니다. 다르면 종료 코드 1을 반환합니다.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.strategies.base_strategy import BaseStrategy
+from src.strategies.mean_reversion_strategy import MeanReversionStrategy, ZScoreStrategy
+
+
+def create_flat_segment_data(rng, days=400, flat_segments=5):
+    """가격이 일정한 구간이 섞인 랜덤 워크 OHLCV 데이터 생성"""
+    close = np.round(100 + rng.standard_normal(days).cumsum(), 2)
+    for _ in range(flat_segments):
+        start = rng.integers(0, days - 40)
+        close[start:start + rng.integers(5, 40)] = close[start]
+
+    return pd.DataFrame({
+        'Open': close,
+        'High': close,
+        'Low': close,
+        'Close': close,
+        'Volume': 1000000.0
+    }, index=pd.date_range('2020-01-01', periods=days, freq='D'))
+
+
+def reference_zscore_signal(df, strategy):
+    """pandas rolling으로 계산한 ZScore 시그널"""
+    close = df['Close']
+    rolling = close.rolling(window=strategy.period)
+    zscore = ((close - rolling.mean()) / rolling.std()).to_numpy()
+
+    return np.select(
+        [
+            np.abs(zscore) < strategy.exit_threshold,
+            zscore > strategy.entry_threshold,
+            zscore < -strategy.entry_threshold
+        ],
+        [BaseStrategy.HOLD, BaseStrategy.SELL, BaseStrategy.BUY],
+        default=BaseStrategy.HOLD
+    )
+
+
+def reference_mean_reversion_signal(df, strategy):
+    """pandas rolling으로 계산한 볼린저 밴드 평균 회귀 시그널"""
+    close = df['Close']
+    rolling = close.rolling(window=strategy.period)
+    middle = rolling.mean()
+    std = rolling.std()
+    upper = (middle + std * strategy.std_dev).to_numpy()
+    lower = (middle - std * strategy.std_dev).to_numpy()
+    middle = middle.to_numpy()
+    close = close.to_numpy()
+
+    above = close > upper
+    below = close < lower
+
+    prev_above = np.zeros(len(close), dtype=bool)
+    prev_below = np.zeros(len(close), dtype=bool)
+    prev_above[1:] = above[:-1]
+    prev_below[1:] = below[:-1] & ~above[:-1]
+    exit_mask = (prev_below & (close >= middle)) | (prev_above & (close <= middle))
+
+    return np.select(
+        [exit_mask, above, below],
+        [BaseStrategy.HOLD, BaseStrategy.SELL, BaseStrategy.BUY],
+        default=BaseStrategy.HOLD
+    )
+
+
+def main():
+    print("=" * 80)
+    print("이동평균/표준편차 커널 회귀 점검 (가격 일정 구간 포함)")
+    print("=" * 80)
+
+    rng = np.random.default_rng(42)
+    checks = [
+        (ZScoreStrategy(), reference_zscore_signal),
+        (MeanReversionStrategy(), reference_mean_reversion_signal)
+    ]
+    mismatches = {strategy.name: 0 for strategy, _ in checks}
+
+    for _ in range(200):
+        df = create_flat_segment_data(rng)
+        for strategy, reference in checks:
+            signal = strategy.generate_signals(df)['Signal'].to_numpy()
+            mismatches[strategy.name] += int((signal != reference(df, strategy)).sum())
+
+    for name, count in mismatches.items():
+        mark = "✓" if count == 0 else "✗"
+        print(f"{mark} {name}: 시그널 불일치 {count}건")
+
+    print("=" * 80)
+    return 0 if not any(mismatches.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,32 +54,55 @@ class Backtester:
         # 전략 적용
         df = strategy.apply_strategy(data)
 
+        # 새 컬럼은 지역 변수로 계산한 뒤 한 번에 붙임 (컬럼별 삽입 방지)
+        close = df['Close']
+        position = df['Position']
+
         # 수익률 계산
-        df['Returns'] = df['Close'].pct_change()
+        returns = close.pct_change()
 
         # 포지션 크기 조정
-        df['Position_Size'] = df['Position'] * position_size
+        sized_position = position * position_size
 
         # 거래 비용 계산
-        df['Trade'] = df['Position'].diff().abs()
-        df['Commission_Cost'] = df['Trade'] * self.commission
-        df['Slippage_Cost'] = df['Trade'] * self.slippage
-        df['Total_Cost'] = df['Commission_Cost'] + df['Slippage_Cost']
+        trade = position.diff().abs()
+        commission_cost = trade * self.commission
+        slippage_cost = trade * self.slippage
+        total_cost = commission_cost + slippage_cost
 
         # 전략 수익률 (비용 포함)
-        df['Strategy_Returns'] = (
-            df['Position_Size'].shift(1) * df['Returns'] - df['Total_Cost']
-        )
+        strategy_returns = sized_position.shift(1) * returns - total_cost
 
         # 누적 수익률
-        df['Cumulative_Returns'] = (1 + df['Strategy_Returns']).cumprod()
+        cumulative_returns = (1 + strategy_returns).cumprod()
 
         # 포트폴리오 가치
-        df['Portfolio_Value'] = self.initial_capital * df['Cumulative_Returns']
+        portfolio_value = self.initial_capital * cumulative_returns
 
         # 드로우다운 계산
-        df['Peak'] = df['Portfolio_Value'].cummax()
-        df['Drawdown'] = (df['Portfolio_Value'] - df['Peak']) / df['Peak']
+        peak = portfolio_value.cummax()
+        drawdown = (portfolio_value - peak) / peak
+
+        columns = {
+            'Returns': returns,
+            'Position_Size': sized_position,
+            'Trade': trade,
+            'Commission_Cost': commission_cost,
+            'Slippage_Cost': slippage_cost,
+            'Total_Cost': total_cost,
+            'Strategy_Returns': strategy_returns,
+            'Cumulative_Returns': cumulative_returns,
+            'Portfolio_Value': portfolio_value,
+            'Peak': peak,
+            'Drawdown': drawdown
+        }
+
+        # 전략이 이미 만든 같은 이름의 컬럼(예: Position_Size)은 새 값으로 대체
+        df = pd.concat(
+            [df.drop(columns=df.columns.intersection(columns.keys())),
+             pd.DataFrame(columns, index=df.index)],
+            axis=1
+        )
 
         self.results = df
 
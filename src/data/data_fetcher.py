@@ -229,11 +229,13 @@ class DataFetcher:
         Returns:
             DataFrame: 수익률이 추가된 데이터프레임
         """
-        df = df.copy()
-        df['Returns'] = df['Close'].pct_change()
-        df['Cumulative_Returns'] = (1 + df['Returns']).cumprod()
+        returns = df['Close'].pct_change()
 
-        return df
+        # 입력을 복사해 컬럼을 하나씩 넣는 대신 한 번에 추가
+        return df.assign(
+            Returns=returns,
+            Cumulative_Returns=(1 + returns).cumprod()
+        )
 
     def resample_data(self, df: pd.DataFrame, freq: str = 'W') -> pd.DataFrame:
         """
@@ -0,0 +1,511 @@
+"""
+전략용 numba 커널
+행 단위 상태 추적이 필요한 전략 루프와 다중 비교 시그널을 NumPy 배열 기반으로 컴파일
+"""
+
+import numpy as np
+from ..utils._njit import njit, prange
+
+
+# DailyDCA 매수 조건 코드
+BUY_NONE = 0
+BUY_FIRST_DAY = 1
+BUY_DAILY_DROP = 2
+BUY_PULLBACK = 3
+
+
+@njit(cache=True)
+def _scaled_quantity(
+    drop_from_avg,
+    position_scaling,
+    base_quantity,
+    depth_threshold,
+    max_quantity_multiplier
+):
+    """평균 매수가 대비 하락 깊이에 따른 매수 수량 (DailyDCAStrategy._calculate_quantity 와 동일)"""
+    if not position_scaling:
+        return base_quantity
+
+    multiplier = 1 + int(drop_from_avg / depth_threshold)
+    multiplier = min(multiplier, max_quantity_multiplier)
+
+    return base_quantity * multiplier
+
+
+@njit(cache=True, nogil=True)
+def _daily_dca_loop(
+    close,
+    recent_high,
+    max_positions,
+    profit_target_percent,
+    first_day_buy,
+    pullback_percent,
+    position_scaling,
+    base_quantity,
+    depth_threshold,
+    max_quantity_multiplier
+):
+    """
+    DailyDCA 상태 머신 (회차별 개별 익절 + 트레일링 매수 + 포지션 스케일링)
+
+    Args:
+        close: 종가 배열 (전일 종가는 close[i - 1]로 직접 참조)
+        recent_high: 최근 N일 최고가 배열
+
+    Returns:
+        tuple: (Signal, Position_Count, Total_Quantity, Sell_Count,
+                Buy_Quantity, 매수 조건 코드, 고점 대비 하락률)
+    """
+    n = close.shape[0]
+
+    signal = np.zeros(n, np.int8)
+    position_count = np.zeros(n, np.int32)
+    total_quantity = np.zeros(n, np.int64)
+    sell_count = np.zeros(n, np.int32)
+    buy_quantity = np.zeros(n, np.int64)
+    buy_condition = np.zeros(n, np.int8)
+    drop_from_high = np.zeros(n, np.float64)
+
+    # 회차별 (매수가, 수량) 버퍼: 최대 회차 + 첫날 매수 가능 횟수
+    # (첫 행과 전일 종가가 NaN인 행은 첫날로 처리)
+    capacity = max(max_positions, 0)
+    for i in range(n):
+        if i == 0 or np.isnan(close[i - 1]):
+            capacity += 1
+
+    lot_prices = np.empty(capacity, np.float64)
+    lot_quantities = np.empty(capacity, np.int64)
+    n_lots = 0
+
+    # 보유 회차 누적 합계 (매수 시 더하고, 매도 시 남은 회차로 다시 합산)
+    # 회차 순서대로 더하므로 매번 전체를 합산한 값과 동일
+    total_cost = 0.0
+    total_qty = 0
+
+    for i in range(n):
+        current_close = close[i]
+        prev = close[i - 1] if i > 0 else np.nan
+        high = recent_high[i]
+
+        # 첫날 처리
+        if np.isnan(prev):
+            if first_day_buy:
+                signal[i] = 1
+                buy_condition[i] = BUY_FIRST_DAY
+                buy_quantity[i] = base_quantity
+                lot_prices[n_lots] = current_close
+                lot_quantities[n_lots] = base_quantity
+                n_lots += 1
+                total_cost += current_close * base_quantity
+                total_qty += base_quantity
+        else:
+            should_buy = False
+            reason = BUY_NONE
+            drop = 0.0
+
+            # 조건 1: 전일 종가보다 하락
+            if current_close < prev:
+                should_buy = True
+                reason = BUY_DAILY_DROP
+
+            # 조건 2: 최근 고점 대비 일정 % 하락
+            if not np.isnan(high) and high > 0:
+                drop = ((high - current_close) / high) * 100
+                if drop >= pullback_percent:
+                    should_buy = True
+                    reason = BUY_PULLBACK
+
+            if should_buy and n_lots < max_positions:
+                # 평균 매수가 대비 하락률 계산 (스케일링용)
+                if n_lots > 0:
+                    if total_qty > 0:
+                        avg_price = total_cost / total_qty
+                    else:
+                        avg_price = current_close
+                    drop_from_avg = ((avg_price - current_close) / avg_price) * 100
+                else:
+                    drop_from_avg = 0.0
+
+                quantity = _scaled_quantity(
+                    drop_from_avg, position_scaling, base_quantity,
+                    depth_threshold, max_quantity_multiplier
+                )
+
+                signal[i] = 1
+                buy_condition[i] = reason
+                drop_from_high[i] = drop
+                buy_quantity[i] = quantity
+                lot_prices[n_lots] = current_close
+                lot_quantities[n_lots] = quantity
+                n_lots += 1
+                total_cost += current_close * quantity
+                total_qty += quantity
+
+            # 매도 조건: 전일보다 상승 + 수익난 회차 있음
+            elif current_close > prev and n_lots > 0:
+                sells = 0
+                kept = 0
+                kept_cost = 0.0
+                kept_qty = 0
+                for j in range(n_lots):
+                    buy_price = lot_prices[j]
+                    if ((current_close - buy_price) / buy_price) * 100 >= profit_target_percent:
+                        sells += 1
+                    else:
+                        quantity = lot_quantities[j]
+                        lot_prices[kept] = buy_price
+                        lot_quantities[kept] = quantity
+                        kept_cost += buy_price * quantity
+                        kept_qty += quantity
+                        kept += 1
+
+                if sells > 0:
+                    signal[i] = -1
+                    sell_count[i] = sells
+                    n_lots = kept
+                    total_cost = kept_cost
+                    total_qty = kept_qty
+
+        # 현재 상태 기록
+        position_count[i] = n_lots
+        total_quantity[i] = total_qty
+
+    return (
+        signal, position_count, total_quantity, sell_count,
+        buy_quantity, buy_condition, drop_from_high
+    )
+
+
+@njit(parallel=True, cache=True)
+def _daily_dca_grid(
+    close,
+    recent_high,
+    max_positions,
+    profit_target_percents,
+    first_day_buy,
+    pullback_percent,
+    position_scaling,
+    base_quantity,
+    depth_threshold,
+    max_quantity_multiplier
+):
+    """
+    DailyDCA 파라미터 그리드 병렬 실행
+
+    (max_positions[p], profit_target_percents[p]) 조합마다 _daily_dca_loop를
+    독립적으로 실행하며, 조합 단위로 prange 병렬화
+
+    Args:
+        close: 종가 배열
+        recent_high: 최근 N일 최고가 배열
+        max_positions: 조합별 최대 매수 회차 배열
+        profit_target_percents: 조합별 익절 기준 배열 (%)
+
+    Returns:
+        tuple: (Signal, Position_Count, Total_Quantity, Sell_Count, Buy_Quantity)
+               각각 (조합 수, 행 수) 2차원 배열
+    """
+    n_params = max_positions.shape[0]
+    n = close.shape[0]
+
+    signal = np.zeros((n_params, n), np.int8)
+    position_count = np.zeros((n_params, n), np.int32)
+    total_quantity = np.zeros((n_params, n), np.int64)
+    sell_count = np.zeros((n_params, n), np.int32)
+    buy_quantity = np.zeros((n_params, n), np.int64)
+
+    for p in prange(n_params):
+        result = _daily_dca_loop(
+            close, recent_high,
+            max_positions[p], profit_target_percents[p],
+            first_day_buy, pullback_percent, position_scaling,
+            base_quantity, depth_threshold, max_quantity_multiplier
+        )
+        signal[p] = result[0]
+        position_count[p] = result[1]
+        total_quantity[p] = result[2]
+        sell_count[p] = result[3]
+        buy_quantity[p] = result[4]
+
+    return signal, position_count, total_quantity, sell_count, buy_quantity
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _daily_dca_multi(
+    close,
+    recent_high,
+    offsets,
+    max_positions,
+    profit_target_percent,
+    first_day_buy,
+    pullback_percent,
+    position_scaling,
+    base_quantity,
+    depth_threshold,
+    max_quantity_multiplier
+):
+    """
+    여러 종목의 DailyDCA 상태 머신 병렬 실행
+
+    종목별 종가를 이어 붙인 배열에서 offsets[k]:offsets[k + 1] 구간마다
+    _daily_dca_loop를 독립적으로 실행하며, 종목 단위로 prange 병렬화
+
+    Args:
+        close: 종목별 종가를 이어 붙인 배열
+        recent_high: 종목별 최근 N일 최고가를 이어 붙인 배열
+        offsets: 종목 구간 경계 배열 (길이 = 종목 수 + 1)
+
+    Returns:
+        tuple: _daily_dca_loop와 같은 순서의 결과 배열 (이어 붙인 형태)
+    """
+    n = close.shape[0]
+
+    signal = np.zeros(n, np.int8)
+    position_count = np.zeros(n, np.int32)
+    total_quantity = np.zeros(n, np.int64)
+    sell_count = np.zeros(n, np.int32)
+    buy_quantity = np.zeros(n, np.int64)
+    buy_condition = np.zeros(n, np.int8)
+    drop_from_high = np.zeros(n, np.float64)
+
+    for k in prange(offsets.shape[0] - 1):
+        start = offsets[k]
+        stop = offsets[k + 1]
+        result = _daily_dca_loop(
+            close[start:stop], recent_high[start:stop],
+            max_positions, profit_target_percent,
+            first_day_buy, pullback_percent, position_scaling,
+            base_quantity, depth_threshold, max_quantity_multiplier
+        )
+        signal[start:stop] = result[0]
+        position_count[start:stop] = result[1]
+        total_quantity[start:stop] = result[2]
+        sell_count[start:stop] = result[3]
+        buy_quantity[start:stop] = result[4]
+        buy_condition[start:stop] = result[5]
+        drop_from_high[start:stop] = result[6]
+
+    return (
+        signal, position_count, total_quantity, sell_count,
+        buy_quantity, buy_condition, drop_from_high
+    )
+
+
+@njit(cache=True, nogil=True)
+def _volatility_breakout_loop(close, breakout_price, profit_target, stop_loss):
+    """
+    변동성 돌파 진입/청산 상태 머신
+
+    Args:
+        close: 종가 배열
+        breakout_price: 돌파 가격 배열 (첫날은 NaN)
+        profit_target: 목표 수익률 (%)
+        stop_loss: 손절 기준 (%)
+
+    Returns:
+        tuple: (Signal, Entry_Price)
+    """
+    n = close.shape[0]
+
+    signal = np.zeros(n, np.int8)
+    entry_out = np.zeros(n, np.float64)
+
+    in_position = False
+    entry_price = 0.0
+
+    for i in range(n):
+        current_price = close[i]
+        breakout = breakout_price[i]
+
+        if not in_position:
+            # 돌파 시 매수
+            if current_price > breakout and not np.isnan(breakout):
+                signal[i] = 1
+                entry_price = current_price
+                entry_out[i] = entry_price
+                in_position = True
+        else:
+            entry_out[i] = entry_price
+
+            # 수익률 계산
+            profit_pct = ((current_price - entry_price) / entry_price) * 100
+
+            # 목표 수익률 도달 또는 손절
+            if profit_pct >= profit_target or profit_pct <= -stop_loss:
+                signal[i] = -1
+                in_position = False
+                entry_price = 0.0
+
+    return signal, entry_out
+
+
+@njit(parallel=True, cache=True)
+def _volatility_breakout_grid(
+    close,
+    prev_close,
+    prev_range,
+    breakout_ratios,
+    profit_targets,
+    stop_losses
+):
+    """
+    변동성 돌파 파라미터 그리드 병렬 실행
+
+    조합마다 돌파 가격(전일 종가 + 전일 변동폭 × 돌파 비율)을 만들어
+    _volatility_breakout_loop를 독립적으로 실행하며, 조합 단위로 prange 병렬화
+
+    Args:
+        close: 종가 배열
+        prev_close: 전일 종가 배열 (첫날은 NaN)
+        prev_range: 전일 변동폭 배열 (첫날은 NaN)
+        breakout_ratios: 조합별 돌파 비율 배열
+        profit_targets: 조합별 목표 수익률 배열 (%)
+        stop_losses: 조합별 손절 기준 배열 (%)
+
+    Returns:
+        tuple: (Signal, Entry_Price) 각각 (조합 수, 행 수) 2차원 배열
+    """
+    n_params = breakout_ratios.shape[0]
+    n = close.shape[0]
+
+    signal = np.zeros((n_params, n), np.int8)
+    entry_price = np.zeros((n_params, n), np.float64)
+
+    for p in prange(n_params):
+        breakout_price = prev_close + (prev_range * breakout_ratios[p])
+        result = _volatility_breakout_loop(
+            close, breakout_price, profit_targets[p], stop_losses[p]
+        )
+        signal[p] = result[0]
+        entry_price[p] = result[1]
+
+    return signal, entry_price
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _volatility_breakout_multi(close, breakout_price, offsets, profit_target, stop_loss):
+    """
+    여러 종목의 변동성 돌파 상태 머신 병렬 실행
+
+    이어 붙인 배열의 offsets[k]:offsets[k + 1] 구간마다
+    _volatility_breakout_loop를 독립적으로 실행 (종목 단위 prange)
+
+    Args:
+        close: 종목별 종가를 이어 붙인 배열
+        breakout_price: 종목별 돌파 가격을 이어 붙인 배열
+        offsets: 종목 구간 경계 배열 (길이 = 종목 수 + 1)
+        profit_target: 목표 수익률 (%)
+        stop_loss: 손절 기준 (%)
+
+    Returns:
+        tuple: (Signal, Entry_Price) (이어 붙인 형태)
+    """
+    n = close.shape[0]
+
+    signal = np.zeros(n, np.int8)
+    entry_out = np.zeros(n, np.float64)
+
+    for k in prange(offsets.shape[0] - 1):
+        start = offsets[k]
+        stop = offsets[k + 1]
+        result = _volatility_breakout_loop(
+            close[start:stop], breakout_price[start:stop], profit_target, stop_loss
+        )
+        signal[start:stop] = result[0]
+        entry_out[start:stop] = result[1]
+
+    return signal, entry_out
+
+
+@njit(cache=True)
+def _grid_depth(distance, spacing, n_levels):
+    """
+    중심 가격으로부터의 거리로 추정한 그리드 레벨 (1 ~ n_levels)
+
+    등간격 레벨이므로 floor(거리 / 간격)로 바로 계산. 반올림 오차로
+    경계에서 한 칸 어긋날 수 있으므로 호출 측에서 실제 레벨과 비교해 보정
+    """
+    if spacing > 0:
+        estimate = distance / spacing
+        if estimate < n_levels:
+            return max(int(estimate), 1)
+    return n_levels
+
+
+@njit(cache=True, nogil=True)
+def _grid_signal(close, center, spacing, buy_levels, sell_levels):
+    """
+    그리드 트레이딩 시그널 (도달한 가장 깊은 레벨, 매도 우선)
+
+    레벨 인덱스를 닫힌 식으로 추정한 뒤 실제 레벨 가격과 비교해 보정하므로
+    레벨 개수와 무관하게 행당 상수 시간이며, 경계값 처리는
+    price <= buy_level / price >= sell_level 비교와 동일함
+
+    Args:
+        close: 종가 배열
+        center: 중심 가격
+        spacing: 레벨 간 가격 간격 (center * grid_size / 100)
+        buy_levels: 매수 레벨 배열 (1단계부터 내림차순)
+        sell_levels: 매도 레벨 배열 (1단계부터 오름차순)
+
+    Returns:
+        tuple: (Signal, Grid_Level)
+    """
+    n = close.shape[0]
+    n_levels = buy_levels.shape[0]
+
+    signal = np.zeros(n, np.int8)
+    grid_level = np.zeros(n, np.int16)
+
+    if n_levels == 0:
+        return signal, grid_level
+
+    for i in range(n):
+        price = close[i]
+
+        if price >= sell_levels[0]:
+            depth = _grid_depth(price - center, spacing, n_levels)
+            while depth < n_levels and price >= sell_levels[depth]:
+                depth += 1
+            while depth > 1 and price < sell_levels[depth - 1]:
+                depth -= 1
+            signal[i] = -1
+            grid_level[i] = depth
+        elif price <= buy_levels[0]:
+            depth = _grid_depth(center - price, spacing, n_levels)
+            while depth < n_levels and price <= buy_levels[depth]:
+                depth += 1
+            while depth > 1 and price > buy_levels[depth - 1]:
+                depth -= 1
+            signal[i] = 1
+            grid_level[i] = -depth
+
+    return signal, grid_level
+
+
+@njit(cache=True, nogil=True)
+def _triple_cross_signal(fast, medium, slow):
+    """
+    삼중 이동평균 정배열/역배열 시그널 (비교 결과 임시 배열 없이 한 번에 계산)
+
+    Args:
+        fast: 빠른 이동평균 배열
+        medium: 중간 이동평균 배열
+        slow: 느린 이동평균 배열
+
+    Returns:
+        ndarray: Signal 배열 (정배열 1, 역배열 -1, 그 외/NaN 0)
+    """
+    n = fast.shape[0]
+    signal = np.zeros(n, np.int8)
+
+    for i in range(n):
+        f = fast[i]
+        m = medium[i]
+        s = slow[i]
+        if f > m and m > s:
+            signal[i] = 1
+        elif f < m and m < s:
+            signal[i] = -1
+
+    return signal
@@ -6,7 +6,15 @@
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from ..utils._njit import as_f64
+
+
+# pandas 3부터는 Copy-on-Write가 기본이라 concat이 원본 블록을 복사하지 않음.
+# pandas 2에서는 copy=False를 명시해야 OHLCV 컬럼 전체 복사를 피할 수 있음
+# (pandas 3에서는 copy 인자가 deprecated)
+_CONCAT_KWARGS = {} if int(pd.__version__.split('.')[0]) >= 3 else {'copy': False}
 
 
 class BaseStrategy(ABC):
@@ -15,17 +23,55 @@ class BaseStrategy(ABC):
     모든 트레이딩 전략은 이 클래스를 상속받아야 함
     """
 
-    def __init__(self, name: str = "BaseStrategy"):
+    # 시그널 값 (np.select 등에서 int8 결과를 바로 만들기 위해 int8 스칼라로 정의)
+    BUY = np.int8(1)
+    SELL = np.int8(-1)
+    HOLD = np.int8(0)
+
+    # 전략 출력 컬럼의 dtype 규약
+    # Signal은 {-1, 0, 1}, Position_Size는 [0, 1] 범위만 가지므로 작은 타입으로 저장
+    # 회차 수(Position_Count, Sell_Count)는 최대 회차 이하의 작은 정수
+    OUTPUT_DTYPES = {
+        'Signal': np.int8,
+        'Position_Size': np.float32,
+        'Grid_Level': np.int16,
+        'Position_Count': np.int32,
+        'Sell_Count': np.int32,
+    }
+
+    # 전략 이름 형식 (인스턴스 속성으로 채움, name을 처음 읽을 때 한 번만 생성)
+    NAME_FORMAT = "BaseStrategy"
+
+    def __init__(self, name: Optional[str] = None):
         """
         BaseStrategy 초기화
 
         Args:
-            name: 전략 이름
+            name: 전략 이름 (None이면 NAME_FORMAT으로 생성)
         """
-        self.name = name
+        self._name = name
         self.signals = None
         self.positions = None
 
+    @property
+    def name(self) -> str:
+        """
+        전략 이름
+
+        파라미터 스윕처럼 인스턴스를 대량 생성할 때 쓰이지 않는 이름 문자열을
+        만들지 않도록 처음 읽을 때 생성함
+
+        Returns:
+            str: 전략 이름
+        """
+        if self._name is None:
+            self._name = self.NAME_FORMAT.format(**vars(self))
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+
     @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -39,6 +85,201 @@ class BaseStrategy(ABC):
         """
         pass
 
+    @staticmethod
+    def _symbol_keys(panel: pd.DataFrame, symbol_column: str) -> np.ndarray:
+        """
+        멀티 종목 패널에서 행별 종목 키 추출
+
+        Args:
+            panel: 종목 컬럼 또는 종목 인덱스 레벨을 가진 long 형식 데이터프레임
+            symbol_column: 종목 컬럼(또는 인덱스 레벨) 이름
+
+        Returns:
+            ndarray: 행별 종목 키 배열
+        """
+        if symbol_column in panel.columns:
+            return panel[symbol_column].to_numpy()
+        if symbol_column in panel.index.names:
+            return panel.index.get_level_values(symbol_column).to_numpy()
+
+        raise ValueError(f"Symbol column '{symbol_column}' not found in panel")
+
+    def generate_signals_batch(self, panel: pd.DataFrame, symbol_column: str = 'Symbol') -> pd.DataFrame:
+        """
+        멀티 종목 패널의 시그널을 한 번에 생성
+
+        기본 구현은 종목별로 generate_signals를 호출한 뒤 원래 행 순서로 합침.
+        종목 간 독립적인 배열 연산만 필요한 전략은 전체 배열을 한 번에 처리하도록 재정의
+
+        Args:
+            panel: 종목 컬럼(또는 인덱스 레벨)을 가진 long 형식 OHLCV 데이터프레임
+            symbol_column: 종목 컬럼(또는 인덱스 레벨) 이름
+
+        Returns:
+            DataFrame: 시그널이 추가된 패널 (입력과 같은 행 순서)
+        """
+        keys = self._symbol_keys(panel, symbol_column)
+        groups = panel.groupby(keys, sort=False, dropna=False).indices
+
+        positions = list(groups.values())
+        results = [self.generate_signals(panel.iloc[rows]) for rows in positions]
+        result = pd.concat(results)
+
+        # 종목별로 모인 행을 입력 순서로 되돌림
+        order = np.argsort(np.concatenate(positions), kind='stable')
+        return result.iloc[order]
+
+    def generate_signals_parallel(
+        self,
+        panel_dict: Dict[str, pd.DataFrame],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        종목별 데이터프레임의 시그널을 병렬로 생성
+
+        기본 구현은 스레드 풀에서 종목별로 generate_signals를 호출함.
+        numba 커널은 GIL을 해제(nogil)하므로 커널 구간은 여러 코어에서 동시에 실행됨.
+        종목 루프 전체를 하나의 병렬 커널로 처리할 수 있는 전략은 재정의
+
+        Args:
+            panel_dict: {종목: OHLCV 데이터프레임} 딕셔너리
+            max_workers: 최대 스레드 수 (None이면 기본값)
+
+        Returns:
+            dict: {종목: 시그널이 추가된 데이터프레임} (입력과 같은 순서)
+        """
+        if not panel_dict:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.generate_signals, panel_dict.values())
+            return dict(zip(panel_dict.keys(), results))
+
+    @staticmethod
+    def _as_2d(close: np.ndarray) -> np.ndarray:
+        """
+        (행 수, 종목 수) 형태의 float64 가격 배열로 변환
+
+        Args:
+            close: 2차원 가격 배열
+
+        Returns:
+            ndarray: float64 2차원 배열
+        """
+        close = np.asarray(close, dtype=np.float64)
+        if close.ndim != 2:
+            raise ValueError(f"Expected a 2D (rows, symbols) array, got shape {close.shape}")
+        return close
+
+    @staticmethod
+    def _cast_outputs(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        배열 결과에 출력 dtype 규약(OUTPUT_DTYPES) 적용
+
+        Args:
+            columns: {컬럼명: 배열} 딕셔너리
+
+        Returns:
+            dict: dtype을 맞춘 딕셔너리
+        """
+        return {
+            name: np.asarray(values).astype(BaseStrategy.OUTPUT_DTYPES[name], copy=False)
+            if name in BaseStrategy.OUTPUT_DTYPES else values
+            for name, values in columns.items()
+        }
+
+    def generate_signals_2d(self, close: np.ndarray, **ohlc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (행 수, 종목 수) 가격 배열의 시그널을 종목 전체에 대해 한 번에 생성
+
+        기본 구현은 종목(열)마다 DataFrame을 만들어 generate_signals를 호출하고
+        숫자형 결과 컬럼을 2차원 배열로 모음. 배열 연산이 종목 축으로 그대로
+        확장되는 전략과 상태 머신 커널을 쓰는 전략은 재정의
+
+        Args:
+            close: 종가 2차원 배열 (행 = 시점, 열 = 종목)
+            **ohlc: 추가 가격 2차원 배열 (컬럼명 기준, 예: High=..., Low=...)
+
+        Returns:
+            dict: {컬럼명: (행 수, 종목 수) 배열}
+        """
+        close = self._as_2d(close)
+        ohlc = {name: np.asarray(values) for name, values in ohlc.items()}
+        n, n_symbols = close.shape
+
+        columns = {}
+        for k in range(n_symbols):
+            frame = pd.DataFrame({
+                'Close': close[:, k],
+                **{name: values[:, k] for name, values in ohlc.items()}
+            })
+            result = self.generate_signals(frame)
+
+            for name in result.columns:
+                if name in frame.columns:
+                    continue
+                values = result[name].to_numpy()
+                # 문자열 등 숫자가 아닌 컬럼은 제외
+                if values.dtype.kind not in 'biuf':
+                    continue
+                if name not in columns:
+                    columns[name] = np.empty((n, n_symbols), dtype=values.dtype)
+                columns[name][:, k] = values
+
+        return columns
+
+    @staticmethod
+    def _attach_columns(data: pd.DataFrame, columns: Dict[str, object]) -> pd.DataFrame:
+        """
+        새로 계산한 컬럼들을 한 번의 concat으로 원본 데이터에 붙임
+
+        컬럼을 하나씩 추가할 때 생기는 DataFrame 단편화를 피하고,
+        원본 데이터프레임은 변경하지 않음.
+        원본 컬럼은 복사하지 않고 공유하므로 비용은 새 컬럼 크기에만 비례함
+        (원본 데이터는 호출자가 소유하며 결과의 원본 컬럼을 제자리 수정하지 않아야 함).
+        OUTPUT_DTYPES에 정의된 컬럼은 규약된 dtype으로 맞춤
+
+        Args:
+            data: 원본 OHLCV 데이터프레임
+            columns: {컬럼명: 배열 또는 Series} 딕셔너리
+
+        Returns:
+            DataFrame: 새 컬럼이 추가된 데이터프레임
+        """
+        new_columns = pd.DataFrame(columns, index=data.index)
+
+        # 출력 dtype 규약 적용 (이미 맞는 컬럼은 그대로 유지)
+        dtypes = {
+            column: dtype for column, dtype in BaseStrategy.OUTPUT_DTYPES.items()
+            if column in new_columns.columns and new_columns[column].dtype != dtype
+        }
+        if dtypes:
+            new_columns = new_columns.astype(dtypes)
+
+        # 같은 이름의 기존 컬럼은 새 값으로 대체
+        overlap = data.columns.intersection(new_columns.columns)
+        if len(overlap) > 0:
+            data = data.drop(columns=overlap)
+
+        return pd.concat([data, new_columns], axis=1, **_CONCAT_KWARGS)
+
+    @staticmethod
+    def _prepare(data: pd.DataFrame) -> Tuple[np.ndarray, int, pd.Index]:
+        """
+        종가를 연속된 float64 NumPy 배열로 한 번만 변환
+
+        시그널 계산 중 Series 연산(인덱스 정렬, dtype 검사) 오버헤드를 피하기 위해 사용.
+        임계값 비교와 변동률 계산의 결과가 달라지지 않도록 float64를 유지
+
+        Args:
+            data: OHLCV 데이터프레임
+
+        Returns:
+            tuple: (종가 배열, 행 수, 인덱스)
+        """
+        close = as_f64(data['Close'])
+        return close, close.shape[0], data.index
+
     def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
         """
         시그널을 기반으로 포지션 계산
@@ -49,15 +290,15 @@ class BaseStrategy(ABC):
         Returns:
             DataFrame: 포지션이 추가된 데이터프레임
         """
-        df = signals.copy()
-
         # Signal: 1 = 매수, -1 = 매도, 0 = 관망
-        df['Position'] = df['Signal'].fillna(0)
-
-        # 포지션 변화 감지
-        df['Position_Change'] = df['Position'].diff()
-
-        return df
+        # int8 Signal의 diff가 float32로 계산되지 않도록 포지션은 int64로 확장
+        position = signals['Signal'].fillna(0).astype(np.int64)
+
+        # 포지션 변화 감지 (시그널 데이터프레임은 복사/변경하지 않음)
+        return self._attach_columns(signals, {
+            'Position': position,
+            'Position_Change': position.diff()
+        })
 
     def get_trade_log(self, positions: pd.DataFrame) -> pd.DataFrame:
         """
@@ -4,8 +4,36 @@ MACD 지표 기반 트레이딩 전략
 """
 
 import pandas as pd
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..utils.indicators import TechnicalIndicators
+from ..utils._njit import as_f64
+
+
+def _level_cross_signal(values: np.ndarray, level: float) -> np.ndarray:
+    """
+    기준선 돌파 시그널 (상향 돌파 1, 하향 돌파 -1, 그 외 0)
+
+    기준선 대비 부호를 한 번만 계산하고 전일 부호와 비교하여
+    상향/하향 돌파를 동시에 판별
+
+    Args:
+        values: 지표 값 배열
+        level: 기준선
+
+    Returns:
+        ndarray: 시그널 배열
+    """
+    sign_now = np.sign(values - level)
+    sign_prev = np.empty_like(sign_now)
+    sign_prev[:1] = np.nan
+    sign_prev[1:] = sign_now[:-1]
+
+    signal = np.zeros(len(values), dtype=np.int8)
+    signal[(sign_now > 0) & (sign_prev <= 0)] = 1
+    signal[(sign_now < 0) & (sign_prev >= 0)] = -1
+
+    return signal
 
 
 class MACDStrategy(BaseStrategy):
@@ -14,6 +42,8 @@ class MACDStrategy(BaseStrategy):
     MACD 라인이 시그널 라인을 상향 돌파 시 매수, 하향 돌파 시 매도
     """
 
+    NAME_FORMAT = "MACD({fast}/{slow}/{signal})"
+
     def __init__(
         self,
         fast: int = 12,
@@ -28,7 +58,7 @@ class MACDStrategy(BaseStrategy):
             slow: 느린 EMA 기간
             signal: 시그널 라인 기간
         """
-        super().__init__(name=f"MACD({fast}/{slow}/{signal})")
+        super().__init__()
         self.fast = fast
         self.slow = slow
         self.signal = signal
@@ -43,24 +73,26 @@ class MACDStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
         # MACD 계산
         macd_df = TechnicalIndicators.calculate_macd(
-            df['Close'], self.fast, self.slow, self.signal
+            data['Close'], self.fast, self.slow, self.signal
+        )
+        macd = macd_df['MACD'].to_numpy()
+        signal_line = macd_df['Signal'].to_numpy()
+
+        # MACD > Signal: 매수, MACD < Signal: 매도
+        signal = np.select(
+            [macd > signal_line, macd < signal_line],
+            [self.BUY, self.SELL],
+            default=self.HOLD
         )
-        df = pd.concat([df, macd_df], axis=1)
-
-        # 시그널 초기화
-        df['Signal'] = 0
-
-        # MACD > Signal: 매수
-        df.loc[df['MACD'] > df['Signal'], 'Signal'] = 1
-
-        # MACD < Signal: 매도
-        df.loc[df['MACD'] < df['Signal'], 'Signal'] = -1
 
-        return df
+        return self._attach_columns(data, {
+            'MACD': macd_df['MACD'],
+            'Signal_Line': macd_df['Signal'],
+            'Histogram': macd_df['Histogram'],
+            'Signal': signal
+        })
 
 
 class MACDHistogramStrategy(BaseStrategy):
@@ -69,6 +101,8 @@ class MACDHistogramStrategy(BaseStrategy):
     히스토그램의 방향 전환을 이용한 전략
     """
 
+    NAME_FORMAT = "MACD_Histogram({fast}/{slow}/{signal})"
+
     def __init__(
         self,
         fast: int = 12,
@@ -85,7 +119,7 @@ class MACDHistogramStrategy(BaseStrategy):
             signal: 시그널 라인 기간
             histogram_threshold: 히스토그램 임계값
         """
-        super().__init__(name=f"MACD_Histogram({fast}/{slow}/{signal})")
+        super().__init__()
         self.fast = fast
         self.slow = slow
         self.signal = signal
@@ -101,35 +135,22 @@ class MACDHistogramStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
         # MACD 계산
         macd_df = TechnicalIndicators.calculate_macd(
-            df['Close'], self.fast, self.slow, self.signal
-        )
-        df = pd.concat([df, macd_df], axis=1)
-
-        # 히스토그램 변화
-        df['Histogram_Change'] = df['Histogram'].diff()
-
-        # 시그널 초기화
-        df['Signal'] = 0
-
-        # 히스토그램이 음수에서 양수로 전환 (상승 모멘텀 시작)
-        bullish = (
-            (df['Histogram'] > self.histogram_threshold) &
-            (df['Histogram'].shift(1) <= self.histogram_threshold)
+            data['Close'], self.fast, self.slow, self.signal
         )
-        df.loc[bullish, 'Signal'] = 1
-
-        # 히스토그램이 양수에서 음수로 전환 (하락 모멘텀 시작)
-        bearish = (
-            (df['Histogram'] < self.histogram_threshold) &
-            (df['Histogram'].shift(1) >= self.histogram_threshold)
+        # 히스토그램이 임계값을 상향 돌파: 매수 (상승 모멘텀 시작)
+        # 히스토그램이 임계값을 하향 돌파: 매도 (하락 모멘텀 시작)
+        signal = _level_cross_signal(
+            as_f64(macd_df['Histogram']), self.histogram_threshold
         )
-        df.loc[bearish, 'Signal'] = -1
 
-        return df
+        return self._attach_columns(data, {
+            'MACD': macd_df['MACD'],
+            'Signal_Line': macd_df['Signal'],
+            'Histogram': macd_df['Histogram'],
+            'Signal': signal
+        })
 
 
 class MACDZeroCrossStrategy(BaseStrategy):
@@ -138,6 +159,8 @@ class MACDZeroCrossStrategy(BaseStrategy):
     MACD가 0선을 돌파하는 시점에 매매
     """
 
+    NAME_FORMAT = "MACD_ZeroCross({fast}/{slow}/{signal})"
+
     def __init__(
         self,
         fast: int = 12,
@@ -152,7 +175,7 @@ class MACDZeroCrossStrategy(BaseStrategy):
             slow: 느린 EMA 기간
             signal: 시그널 라인 기간
         """
-        super().__init__(name=f"MACD_ZeroCross({fast}/{slow}/{signal})")
+        super().__init__()
         self.fast = fast
         self.slow = slow
         self.signal = signal
@@ -167,23 +190,16 @@ class MACDZeroCrossStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
         # MACD 계산
         macd_df = TechnicalIndicators.calculate_macd(
-            df['Close'], self.fast, self.slow, self.signal
+            data['Close'], self.fast, self.slow, self.signal
         )
-        df = pd.concat([df, macd_df], axis=1)
-
-        # 시그널 초기화
-        df['Signal'] = 0
-
-        # MACD가 0선 상향 돌파: 매수
-        bullish_cross = (df['MACD'] > 0) & (df['MACD'].shift(1) <= 0)
-        df.loc[bullish_cross, 'Signal'] = 1
-
-        # MACD가 0선 하향 돌파: 매도
-        bearish_cross = (df['MACD'] < 0) & (df['MACD'].shift(1) >= 0)
-        df.loc[bearish_cross, 'Signal'] = -1
-
-        return df
+        # MACD가 0선 상향 돌파: 매수, 하향 돌파: 매도
+        signal = _level_cross_signal(as_f64(macd_df['MACD']), 0.0)
+
+        return self._attach_columns(data, {
+            'MACD': macd_df['MACD'],
+            'Signal_Line': macd_df['Signal'],
+            'Histogram': macd_df['Histogram'],
+            'Signal': signal
+        })
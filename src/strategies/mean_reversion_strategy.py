@@ -4,8 +4,10 @@
 """
 
 import pandas as pd
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..utils.indicators import TechnicalIndicators
+from ..utils._indicator_cache import rolling_mean_std
 
 
 class MeanReversionStrategy(BaseStrategy):
@@ -14,6 +16,8 @@ class MeanReversionStrategy(BaseStrategy):
     가격이 볼린저 밴드 하단을 이탈하면 매수, 상단을 이탈하면 매도
     """
 
+    NAME_FORMAT = "MeanReversion(BB{period})"
+
     def __init__(
         self,
         period: int = 20,
@@ -28,7 +32,7 @@ class MeanReversionStrategy(BaseStrategy):
             std_dev: 표준편차 배수
             use_close_signal: 중간선 도달 시 포지션 종료 여부
         """
-        super().__init__(name=f"MeanReversion(BB{period})")
+        super().__init__()
         self.period = period
         self.std_dev = std_dev
         self.use_close_signal = use_close_signal
@@ -43,37 +47,51 @@ class MeanReversionStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close, n, _ = self._prepare(data)
 
         # 볼린저 밴드 계산
         bb_df = TechnicalIndicators.calculate_bollinger_bands(
-            df['Close'], self.period, self.std_dev
+            data['Close'], self.period, self.std_dev
         )
-        df = pd.concat([df, bb_df], axis=1)
-
-        # 시그널 생성
-        df['Signal'] = 0
 
-        # 하단 밴드 이탈 시 매수 (과매도)
-        df.loc[df['Close'] < df['BB_Lower'], 'Signal'] = 1
+        upper = bb_df['BB_Upper'].to_numpy()
+        middle = bb_df['BB_Middle'].to_numpy()
+        lower = bb_df['BB_Lower'].to_numpy()
 
-        # 상단 밴드 이탈 시 매도 (과매수)
-        df.loc[df['Close'] > df['BB_Upper'], 'Signal'] = -1
+        # 상단 밴드 이탈 시 매도 (과매수), 하단 밴드 이탈 시 매수 (과매도)
+        above = close > upper
+        below = close < lower
 
-        # 중간선 복귀 시 포지션 종료
         if self.use_close_signal:
-            # 이전 시그널 확인
-            prev_signal = df['Signal'].shift(1)
+            # 전일 밴드 이탈 방향 (전일 시그널과 동일, 첫 행은 0)
+            prev_above = np.zeros(n, dtype=bool)
+            prev_below = np.zeros(n, dtype=bool)
+            prev_above[1:] = above[:-1]
+            prev_below[1:] = below[:-1] & ~above[:-1]
 
             # 매수 포지션에서 중간선 도달 시 종료
-            close_long = (prev_signal > 0) & (df['Close'] >= df['BB_Middle'])
-            df.loc[close_long, 'Signal'] = 0
+            close_long = prev_below & (close >= middle)
 
             # 매도 포지션에서 중간선 도달 시 종료
-            close_short = (prev_signal < 0) & (df['Close'] <= df['BB_Middle'])
-            df.loc[close_short, 'Signal'] = 0
+            close_short = prev_above & (close <= middle)
+
+            exit_mask = close_long | close_short
+        else:
+            exit_mask = np.zeros(n, dtype=bool)
 
-        return df
+        # 앞선 조건이 우선 (포지션 종료 > 매도 > 매수)
+        signal = np.select(
+            [exit_mask, above, below],
+            [self.HOLD, self.SELL, self.BUY],
+            default=self.HOLD
+        )
+
+        return self._attach_columns(data, {
+            'BB_Upper': bb_df['BB_Upper'],
+            'BB_Middle': bb_df['BB_Middle'],
+            'BB_Lower': bb_df['BB_Lower'],
+            'Signal': signal
+        })
 
 
 class ZScoreStrategy(BaseStrategy):
@@ -82,6 +100,8 @@ class ZScoreStrategy(BaseStrategy):
     가격의 Z-Score를 계산하여 극단값에서 매매
     """
 
+    NAME_FORMAT = "ZScore({period})"
+
     def __init__(
         self,
         period: int = 20,
@@ -96,7 +116,7 @@ class ZScoreStrategy(BaseStrategy):
             entry_threshold: 진입 임계값 (Z-Score)
             exit_threshold: 청산 임계값 (Z-Score)
         """
-        super().__init__(name=f"ZScore({period})")
+        super().__init__()
         self.period = period
         self.entry_threshold = entry_threshold
         self.exit_threshold = exit_threshold
@@ -111,25 +131,32 @@ class ZScoreStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close, _, _ = self._prepare(data)
 
-        # 이동평균 및 표준편차 계산
-        df['MA'] = df['Close'].rolling(window=self.period).mean()
-        df['Std'] = df['Close'].rolling(window=self.period).std()
+        # 이동평균 및 표준편차 계산 (볼린저 밴드와 캐시 공유)
+        ma, std = rolling_mean_std(close, self.period)
 
         # Z-Score 계산
-        df['ZScore'] = (df['Close'] - df['MA']) / df['Std']
-
-        # 시그널 생성
-        df['Signal'] = 0
-
-        # Z-Score < -entry_threshold: 과매도 -> 매수
-        df.loc[df['ZScore'] < -self.entry_threshold, 'Signal'] = 1
-
-        # Z-Score > entry_threshold: 과매수 -> 매도
-        df.loc[df['ZScore'] > self.entry_threshold, 'Signal'] = -1
-
-        # 0에 가까워지면 포지션 종료
-        df.loc[abs(df['ZScore']) < self.exit_threshold, 'Signal'] = 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            zscore = (close - ma) / std
+
+        # 시그널 생성 (앞선 조건이 우선)
+        signal = np.select(
+            [
+                # 0에 가까워지면 포지션 종료
+                np.abs(zscore) < self.exit_threshold,
+                # Z-Score > entry_threshold: 과매수 -> 매도
+                zscore > self.entry_threshold,
+                # Z-Score < -entry_threshold: 과매도 -> 매수
+                zscore < -self.entry_threshold
+            ],
+            [self.HOLD, self.SELL, self.BUY],
+            default=self.HOLD
+        )
 
-        return df
+        return self._attach_columns(data, {
+            'MA': ma,
+            'Std': std,
+            'ZScore': zscore,
+            'Signal': signal
+        })
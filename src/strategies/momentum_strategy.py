@@ -4,8 +4,11 @@
 """
 
 import pandas as pd
+import numpy as np
 from .base_strategy import BaseStrategy
 from ..utils.indicators import TechnicalIndicators
+from ..utils._njit import as_f64
+from ._kernels import _triple_cross_signal
 
 
 class MomentumStrategy(BaseStrategy):
@@ -14,6 +17,8 @@ class MomentumStrategy(BaseStrategy):
     단기 이동평균선이 장기 이동평균선을 상향 돌파 시 매수, 하향 돌파 시 매도
     """
 
+    NAME_FORMAT = "Momentum({short_window}/{long_window})"
+
     def __init__(
         self,
         short_window: int = 20,
@@ -28,7 +33,7 @@ class MomentumStrategy(BaseStrategy):
             long_window: 장기 이동평균 기간
             use_ema: EMA 사용 여부 (False이면 SMA 사용)
         """
-        super().__init__(name=f"Momentum({short_window}/{long_window})")
+        super().__init__()
         self.short_window = short_window
         self.long_window = long_window
         self.use_ema = use_ema
@@ -43,34 +48,33 @@ class MomentumStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close = data['Close']
 
         # 이동평균선 계산
         if self.use_ema:
-            df['Short_MA'] = TechnicalIndicators.calculate_ema(
-                df['Close'], self.short_window
-            )
-            df['Long_MA'] = TechnicalIndicators.calculate_ema(
-                df['Close'], self.long_window
+            short_ma, long_ma = TechnicalIndicators.calculate_emas(
+                close, [self.short_window, self.long_window]
             )
         else:
-            df['Short_MA'] = TechnicalIndicators.calculate_sma(
-                df['Close'], self.short_window
-            )
-            df['Long_MA'] = TechnicalIndicators.calculate_sma(
-                df['Close'], self.long_window
-            )
+            short_ma = TechnicalIndicators.calculate_sma(close, self.short_window)
+            long_ma = TechnicalIndicators.calculate_sma(close, self.long_window)
 
-        # 시그널 생성
-        df['Signal'] = 0
+        short_values = short_ma.to_numpy()
+        long_values = long_ma.to_numpy()
 
         # 골든 크로스: 단기 MA가 장기 MA를 상향 돌파 (매수)
-        df.loc[df['Short_MA'] > df['Long_MA'], 'Signal'] = 1
-
         # 데드 크로스: 단기 MA가 장기 MA를 하향 돌파 (매도)
-        df.loc[df['Short_MA'] < df['Long_MA'], 'Signal'] = -1
+        signal = np.select(
+            [short_values > long_values, short_values < long_values],
+            [self.BUY, self.SELL],
+            default=self.HOLD
+        )
 
-        return df
+        return self._attach_columns(data, {
+            'Short_MA': short_ma,
+            'Long_MA': long_ma,
+            'Signal': signal
+        })
 
 
 class TripleMomentumStrategy(BaseStrategy):
@@ -79,6 +83,8 @@ class TripleMomentumStrategy(BaseStrategy):
     세 개의 이동평균선을 사용하여 더 정교한 시그널 생성
     """
 
+    NAME_FORMAT = "TripleMomentum({fast_window}/{medium_window}/{slow_window})"
+
     def __init__(
         self,
         fast_window: int = 10,
@@ -93,9 +99,7 @@ class TripleMomentumStrategy(BaseStrategy):
             medium_window: 중간 이동평균 기간
             slow_window: 느린 이동평균 기간
         """
-        super().__init__(
-            name=f"TripleMomentum({fast_window}/{medium_window}/{slow_window})"
-        )
+        super().__init__()
         self.fast_window = fast_window
         self.medium_window = medium_window
         self.slow_window = slow_window
@@ -110,34 +114,24 @@ class TripleMomentumStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close = data['Close']
 
-        # 세 개의 이동평균선 계산
-        df['Fast_MA'] = TechnicalIndicators.calculate_ema(
-            df['Close'], self.fast_window
-        )
-        df['Medium_MA'] = TechnicalIndicators.calculate_ema(
-            df['Close'], self.medium_window
-        )
-        df['Slow_MA'] = TechnicalIndicators.calculate_ema(
-            df['Close'], self.slow_window
+        # 세 개의 이동평균선 계산 (가격 배열 한 번 순회)
+        fast_ma, medium_ma, slow_ma = TechnicalIndicators.calculate_emas(
+            close, [self.fast_window, self.medium_window, self.slow_window]
         )
 
-        # 시그널 생성
-        df['Signal'] = 0
-
         # 강한 매수 신호: Fast > Medium > Slow
-        strong_buy = (
-            (df['Fast_MA'] > df['Medium_MA']) &
-            (df['Medium_MA'] > df['Slow_MA'])
-        )
-        df.loc[strong_buy, 'Signal'] = 1
-
         # 강한 매도 신호: Fast < Medium < Slow
-        strong_sell = (
-            (df['Fast_MA'] < df['Medium_MA']) &
-            (df['Medium_MA'] < df['Slow_MA'])
+        signal = _triple_cross_signal(
+            as_f64(fast_ma),
+            as_f64(medium_ma),
+            as_f64(slow_ma)
         )
-        df.loc[strong_sell, 'Signal'] = -1
 
-        return df
+        return self._attach_columns(data, {
+            'Fast_MA': fast_ma,
+            'Medium_MA': medium_ma,
+            'Slow_MA': slow_ma,
+            'Signal': signal
+        })
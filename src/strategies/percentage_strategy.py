@@ -5,21 +5,165 @@
 
 import pandas as pd
 import numpy as np
+from abc import abstractmethod
 from .base_strategy import BaseStrategy
-from typing import List, Tuple, Optional
+from ..utils._indicator_cache import rolling_max, shifted_change_pct
+from ..utils._njit import as_f64
+from ._kernels import (
+    _daily_dca_loop,
+    _daily_dca_grid,
+    _daily_dca_multi,
+    _grid_signal,
+    _scaled_quantity,
+    _volatility_breakout_grid,
+    _volatility_breakout_loop,
+    _volatility_breakout_multi,
+    BUY_NONE,
+    BUY_FIRST_DAY,
+    BUY_DAILY_DROP,
+    BUY_PULLBACK
+)
+from typing import Dict, List, Sequence, Tuple, Optional
+
+
+def _triggered_level_count(thresholds: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    각 값이 도달한 임계값 개수 (오름차순 임계값 기준)
+
+    thresholds[k-1] <= value 를 만족하는 최대 k를 한 번의 searchsorted로 계산.
+    0이면 어떤 레벨도 도달하지 않음, NaN 값은 0으로 처리
+
+    Args:
+        thresholds: 오름차순 정렬된 임계값 배열
+        values: 비교할 값 배열
+
+    Returns:
+        ndarray: 도달한 레벨 개수 배열
+    """
+    count = np.searchsorted(thresholds, values, side='right')
+    count[np.isnan(values)] = 0
+    return count
+
+
+class _PriceChangeStrategy(BaseStrategy):
+    """
+    lookback 전 종가 대비 변동률(%)로 시그널을 만드는 전략의 공통 베이스
+    하위 클래스는 lookback_days 속성과 _signal_columns를 구현
+    """
+
+    # Reference_Price/Price_Change_Pct 중간 컬럼 출력 여부
+    keep_intermediate = True
+
+    @abstractmethod
+    def _signal_columns(self, pct: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        변동률 배열로부터 시그널 컬럼 계산 (추상 메서드)
+
+        Args:
+            pct: 변동률 배열 (%)
+
+        Returns:
+            dict: {컬럼명: 배열} (Signal 포함)
+        """
+        pass
+
+    def _output_columns(self, reference_price: np.ndarray, pct: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        출력 컬럼 구성 (keep_intermediate가 False면 중간 컬럼 생략)
+
+        Args:
+            reference_price: 기준 가격 배열
+            pct: 변동률 배열 (%)
+
+        Returns:
+            dict: {컬럼명: 배열}
+        """
+        columns = self._signal_columns(pct)
+        if not self.keep_intermediate:
+            return columns
+
+        return {
+            'Reference_Price': reference_price,
+            'Price_Change_Pct': pct,
+            **columns
+        }
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        변동률 기반 시그널 생성
+
+        Args:
+            data: OHLCV 데이터프레임
+
+        Returns:
+            DataFrame: 시그널이 추가된 데이터프레임
+        """
+        close, _, _ = self._prepare(data)
+
+        # 기준 가격 (N일 전 종가) 및 변동률
+        # (shift와 나눗셈뿐이라 내용 해시 캐시보다 다시 계산하는 편이 빠름)
+        reference_price, pct = shifted_change_pct(close, self.lookback_days)
+
+        return self._attach_columns(data, self._output_columns(reference_price, pct))
+
+    def generate_signals_batch(self, panel: pd.DataFrame, symbol_column: str = 'Symbol') -> pd.DataFrame:
+        """
+        멀티 종목 패널의 시그널을 전체 배열 한 번으로 생성
+
+        기준 가격만 종목별로 shift하고, 변동률과 시그널은 패널 전체에 대해 계산
+
+        Args:
+            panel: 종목 컬럼(또는 인덱스 레벨)을 가진 long 형식 OHLCV 데이터프레임
+            symbol_column: 종목 컬럼(또는 인덱스 레벨) 이름
+
+        Returns:
+            DataFrame: 시그널이 추가된 패널 (입력과 같은 행 순서)
+        """
+        keys = self._symbol_keys(panel, symbol_column)
+        close = panel['Close']
+
+        # 종목 경계를 넘지 않도록 종목별 shift
+        reference_price = as_f64(close.groupby(keys, sort=False, dropna=False).shift(
+            self.lookback_days
+        ))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = ((as_f64(close) - reference_price) / reference_price) * 100
+
+        return self._attach_columns(panel, self._output_columns(reference_price, pct))
+
+    def generate_signals_2d(self, close: np.ndarray, **ohlc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (행 수, 종목 수) 종가 배열의 시그널을 한 번의 배열 연산으로 생성
+
+        기준 가격 이동, 변동률, 시그널 선택이 모두 행 방향 연산이므로
+        2차원 배열에 그대로 적용됨
+
+        Args:
+            close: 종가 2차원 배열 (행 = 시점, 열 = 종목)
+            **ohlc: 사용하지 않음 (기본 구현과의 호환용)
+
+        Returns:
+            dict: {컬럼명: (행 수, 종목 수) 배열}
+        """
+        reference_price, pct = shifted_change_pct(self._as_2d(close), self.lookback_days)
+        return self._cast_outputs(self._output_columns(reference_price, pct))
 
 
-class PercentageDropBuyStrategy(BaseStrategy):
+class PercentageDropBuyStrategy(_PriceChangeStrategy):
     """
     하락률 기반 매수 전략
     N% 하락 시 매수, M% 상승 시 매도
     """
 
+    NAME_FORMAT = "DropBuy({drop_percent}%)"
+
     def __init__(
         self,
         drop_percent: float = 5.0,
         sell_profit_percent: float = 3.0,
-        lookback_days: int = 1
+        lookback_days: int = 1,
+        keep_intermediate: bool = True
     ):
         """
         PercentageDropBuyStrategy 초기화
@@ -28,53 +172,50 @@ class PercentageDropBuyStrategy(BaseStrategy):
             drop_percent: 매수 기준 하락률 (%)
             sell_profit_percent: 매도 기준 상승률 (%)
             lookback_days: 기준 가격 lookback 기간 (일)
+            keep_intermediate: Reference_Price/Price_Change_Pct 컬럼 출력 여부
         """
-        super().__init__(name=f"DropBuy({drop_percent}%)")
+        super().__init__()
         self.drop_percent = drop_percent
         self.sell_profit_percent = sell_profit_percent
         self.lookback_days = lookback_days
+        self.keep_intermediate = keep_intermediate
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _signal_columns(self, pct: np.ndarray) -> Dict[str, np.ndarray]:
         """
         하락률 기반 시그널 생성
 
         Args:
-            data: OHLCV 데이터프레임
+            pct: 변동률 배열 (%)
 
         Returns:
-            DataFrame: 시그널이 추가된 데이터프레임
+            dict: Signal 컬럼
         """
-        df = data.copy()
-
-        # 기준 가격 (N일 전 종가)
-        df['Reference_Price'] = df['Close'].shift(self.lookback_days)
-
-        # 현재 가격 대비 변동률
-        df['Price_Change_Pct'] = ((df['Close'] - df['Reference_Price']) / df['Reference_Price']) * 100
-
-        # 시그널 초기화
-        df['Signal'] = 0
-
+        # 상승률이 sell_profit_percent 이상이면 매도 (매수보다 우선)
         # 하락률이 drop_percent 이상이면 매수
-        df.loc[df['Price_Change_Pct'] <= -self.drop_percent, 'Signal'] = 1
+        # int8 선택값으로 한 번에 최종 Signal 배열 생성 (별도 캐스팅 없음)
+        signal = np.select(
+            [pct >= self.sell_profit_percent, pct <= -self.drop_percent],
+            [self.SELL, self.BUY],
+            default=self.HOLD
+        )
 
-        # 상승률이 sell_profit_percent 이상이면 매도
-        df.loc[df['Price_Change_Pct'] >= self.sell_profit_percent, 'Signal'] = -1
+        return {'Signal': signal}
 
-        return df
 
-
-class PyramidingStrategy(BaseStrategy):
+class PyramidingStrategy(_PriceChangeStrategy):
     """
     피라미딩 전략 (하락 시 비중 늘리기)
     하락폭에 따라 단계적으로 매수 비중 증가
     """
 
+    NAME_FORMAT = "Pyramiding"
+
     def __init__(
         self,
         buy_levels: List[Tuple[float, float]] = None,
         sell_profit_percent: float = 5.0,
-        lookback_days: int = 1
+        lookback_days: int = 1,
+        keep_intermediate: bool = True
     ):
         """
         PyramidingStrategy 초기화
@@ -83,47 +224,46 @@ class PyramidingStrategy(BaseStrategy):
             buy_levels: [(하락률, 투자비중), ...] 예: [(3, 0.2), (5, 0.3), (10, 0.5)]
             sell_profit_percent: 매도 기준 상승률 (%)
             lookback_days: 기준 가격 lookback 기간
+            keep_intermediate: Reference_Price/Price_Change_Pct 컬럼 출력 여부
         """
         if buy_levels is None:
             buy_levels = [(3.0, 0.2), (5.0, 0.3), (8.0, 0.3), (12.0, 0.2)]
 
-        super().__init__(name="Pyramiding")
+        super().__init__()
         self.buy_levels = sorted(buy_levels, key=lambda x: x[0])  # 하락률 순 정렬
         self.sell_profit_percent = sell_profit_percent
         self.lookback_days = lookback_days
+        self.keep_intermediate = keep_intermediate
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        # searchsorted용 레벨 배열 (하락률 오름차순)
+        self._buy_drops = np.array([drop_pct for drop_pct, _ in self.buy_levels], dtype=np.float64)
+        self._buy_weights = np.array([weight for _, weight in self.buy_levels], dtype=np.float32)
+
+    def _signal_columns(self, pct: np.ndarray) -> Dict[str, np.ndarray]:
         """
         피라미딩 시그널 생성
 
         Args:
-            data: OHLCV 데이터프레임
+            pct: 변동률 배열 (%)
 
         Returns:
-            DataFrame: 시그널이 추가된 데이터프레임
+            dict: Signal, Position_Size 컬럼
         """
-        df = data.copy()
-
-        # 기준 가격
-        df['Reference_Price'] = df['Close'].shift(self.lookback_days)
-
-        # 변동률 계산
-        df['Price_Change_Pct'] = ((df['Close'] - df['Reference_Price']) / df['Reference_Price']) * 100
+        # 도달한 가장 깊은 하락 레벨의 비중으로 매수
+        level = _triggered_level_count(self._buy_drops, -pct)
+        buy_mask = level > 0
 
-        # 시그널 및 비중 초기화
-        df['Signal'] = 0
-        df['Position_Size'] = 0.0
+        position_size = np.zeros(pct.shape, dtype=np.float32)
+        position_size[buy_mask] = self._buy_weights[level[buy_mask] - 1]
 
-        # 각 하락 레벨에 따라 매수 비중 결정
-        for drop_pct, weight in self.buy_levels:
-            mask = df['Price_Change_Pct'] <= -drop_pct
-            df.loc[mask, 'Signal'] = 1
-            df.loc[mask, 'Position_Size'] = weight
+        # 목표 수익률 도달 시 전량 매도 (매수보다 우선)
+        signal = np.select(
+            [pct >= self.sell_profit_percent, buy_mask],
+            [self.SELL, self.BUY],
+            default=self.HOLD
+        )
 
-        # 목표 수익률 도달 시 전량 매도
-        df.loc[df['Price_Change_Pct'] >= self.sell_profit_percent, 'Signal'] = -1
-
-        return df
+        return {'Signal': signal, 'Position_Size': position_size}
 
 
 class GridTradingStrategy(BaseStrategy):
@@ -132,6 +272,8 @@ class GridTradingStrategy(BaseStrategy):
     일정 간격으로 매수/매도 주문 배치
     """
 
+    NAME_FORMAT = "GridTrading({grid_size}%)"
+
     def __init__(
         self,
         grid_size: float = 3.0,
@@ -146,11 +288,42 @@ class GridTradingStrategy(BaseStrategy):
             num_grids: 그리드 개수
             center_price: 중심 가격 (None이면 첫 종가 사용)
         """
-        super().__init__(name=f"GridTrading({grid_size}%)")
+        super().__init__()
         self.grid_size = grid_size
         self.num_grids = num_grids
         self.center_price = center_price
 
+        # 마지막으로 만든 (키, 그리드 레벨) (중심 가격이 고정이면 생성 시 한 번만 계산)
+        self._levels_cache = None
+        if center_price is not None:
+            self._grid_levels(float(center_price))
+
+    def _grid_levels(self, center: float) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        중심 가격 기준 그리드 레벨 (같은 중심 가격/파라미터면 이전 결과 재사용)
+
+        Args:
+            center: 중심 가격
+
+        Returns:
+            tuple: (매수 레벨 내림차순, 매도 레벨 오름차순, 레벨 간 가격 간격)
+        """
+        key = (center, self.grid_size, self.num_grids)
+        cached = self._levels_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        steps = (self.grid_size / 100) * np.arange(1, self.num_grids + 1)
+        levels = (
+            center * (1 - steps),
+            center * (1 + steps),
+            center * self.grid_size / 100
+        )
+
+        # 키와 레벨을 한 번에 교체 (스레드 병렬 실행 시에도 짝이 어긋나지 않음)
+        self._levels_cache = (key, levels)
+        return levels
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         그리드 트레이딩 시그널 생성
@@ -161,47 +334,23 @@ class GridTradingStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close, n, _ = self._prepare(data)
 
         # 중심 가격 설정
         if self.center_price is None:
-            center = df['Close'].iloc[0]
+            center = float(close[0])
         else:
-            center = self.center_price
-
-        # 그리드 레벨 생성
-        buy_levels = []
-        sell_levels = []
+            center = float(self.center_price)
 
-        for i in range(1, self.num_grids + 1):
-            buy_level = center * (1 - (self.grid_size / 100) * i)
-            sell_level = center * (1 + (self.grid_size / 100) * i)
-            buy_levels.append(buy_level)
-            sell_levels.append(sell_level)
+        buy_levels, sell_levels, spacing = self._grid_levels(center)
 
-        # 시그널 초기화
-        df['Signal'] = 0
-        df['Grid_Level'] = 0
+        # 도달한 가장 깊은 레벨 (매도 레벨 도달이 매수보다 우선)
+        signal, grid_level = _grid_signal(close, center, spacing, buy_levels, sell_levels)
 
-        # 각 행마다 그리드 레벨 확인
-        for idx, row in df.iterrows():
-            price = row['Close']
-
-            # 매수 레벨 체크
-            for level_idx, buy_price in enumerate(buy_levels):
-                if price <= buy_price:
-                    df.loc[idx, 'Signal'] = 1
-                    df.loc[idx, 'Grid_Level'] = -(level_idx + 1)
-                    break
-
-            # 매도 레벨 체크
-            for level_idx, sell_price in enumerate(sell_levels):
-                if price >= sell_price:
-                    df.loc[idx, 'Signal'] = -1
-                    df.loc[idx, 'Grid_Level'] = (level_idx + 1)
-                    break
-
-        return df
+        return self._attach_columns(data, {
+            'Signal': signal,
+            'Grid_Level': grid_level
+        })
 
 
 class DollarCostAveragingStrategy(BaseStrategy):
@@ -210,6 +359,8 @@ class DollarCostAveragingStrategy(BaseStrategy):
     일정 기간마다 일정 금액 매수
     """
 
+    NAME_FORMAT = "DCA({investment_interval}d)"
+
     def __init__(
         self,
         investment_interval: int = 7,  # 일
@@ -222,7 +373,7 @@ class DollarCostAveragingStrategy(BaseStrategy):
             investment_interval: 투자 간격 (일)
             sell_profit_percent: 매도 기준 수익률 (%)
         """
-        super().__init__(name=f"DCA({investment_interval}d)")
+        super().__init__()
         self.investment_interval = investment_interval
         self.sell_profit_percent = sell_profit_percent
 
@@ -236,36 +387,38 @@ class DollarCostAveragingStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
-        # 시그널 초기화
-        df['Signal'] = 0
-        df['Days_Since_Start'] = range(len(df))
+        close, n, _ = self._prepare(data)
+        days_since_start = np.arange(n)
 
-        # 일정 간격마다 매수
-        df.loc[df['Days_Since_Start'] % self.investment_interval == 0, 'Signal'] = 1
+        # 일정 간격마다 매수 (나머지 연산 대신 간격 슬라이스에 한 번에 기록)
+        # 간격이 음수면 절댓값과 같고, 0이면 pandas 나머지 연산(NaN)처럼 매수 없음
+        buy_mask = np.zeros(n, dtype=bool)
+        step = abs(int(self.investment_interval))
+        if step > 0:
+            buy_mask[::step] = True
 
-        # 평균 매수가 계산
-        df['Avg_Buy_Price'] = 0.0
-        cumulative_shares = 0
-        cumulative_cost = 0
+        # 평균 매수가 계산 (매수일 누적 수량/누적 비용의 누적합)
+        cumulative_shares = np.cumsum(buy_mask)
+        cumulative_cost = np.cumsum(np.where(buy_mask, close, 0.0))
 
-        for idx in df.index:
-            if df.loc[idx, 'Signal'] == 1:
-                # 매수
-                cumulative_shares += 1
-                cumulative_cost += df.loc[idx, 'Close']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_buy_price = np.where(
+                cumulative_shares > 0, cumulative_cost / cumulative_shares, 0.0
+            )
 
-            if cumulative_shares > 0:
-                df.loc[idx, 'Avg_Buy_Price'] = cumulative_cost / cumulative_shares
+            # 수익률 계산
+            profit_pct = ((close - avg_buy_price) / avg_buy_price) * 100
 
-        # 수익률 계산 및 매도 시그널
-        df['Profit_Pct'] = ((df['Close'] - df['Avg_Buy_Price']) / df['Avg_Buy_Price']) * 100
+        # 목표 수익률 도달 시 전량 매도 (매수 시그널보다 우선)
+        signal = buy_mask.astype(np.int8)
+        signal[profit_pct >= self.sell_profit_percent] = -1
 
-        # 목표 수익률 도달 시 전량 매도
-        df.loc[df['Profit_Pct'] >= self.sell_profit_percent, 'Signal'] = -1
-
-        return df
+        return self._attach_columns(data, {
+            'Signal': signal,
+            'Days_Since_Start': days_since_start,
+            'Avg_Buy_Price': avg_buy_price,
+            'Profit_Pct': profit_pct
+        })
 
 
 class VolatilityBreakoutStrategy(BaseStrategy):
@@ -274,6 +427,8 @@ class VolatilityBreakoutStrategy(BaseStrategy):
     전일 변동폭의 N% 돌파 시 매수
     """
 
+    NAME_FORMAT = "VolBreakout({breakout_ratio})"
+
     def __init__(
         self,
         breakout_ratio: float = 0.5,
@@ -288,7 +443,7 @@ class VolatilityBreakoutStrategy(BaseStrategy):
             profit_target: 목표 수익률 (%)
             stop_loss: 손절 기준 (%)
         """
-        super().__init__(name=f"VolBreakout({breakout_ratio})")
+        super().__init__()
         self.breakout_ratio = breakout_ratio
         self.profit_target = profit_target
         self.stop_loss = stop_loss
@@ -303,59 +458,175 @@ class VolatilityBreakoutStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
-        # 전일 변동폭
-        df['Prev_Range'] = (df['High'] - df['Low']).shift(1)
+        close, _, _ = self._prepare(data)
+        prev_range, breakout_price = self._breakout_price(
+            close, as_f64(data['High']), as_f64(data['Low'])
+        )
+
+        # 진입/청산 상태 머신은 numba 커널에서 처리
+        signal, entry_price = _volatility_breakout_loop(
+            close,
+            breakout_price,
+            float(self.profit_target),
+            float(self.stop_loss)
+        )
+
+        return self._attach_columns(data, {
+            'Prev_Range': prev_range,
+            'Breakout_Price': breakout_price,
+            'Signal': signal,
+            'Entry_Price': entry_price
+        })
+
+    def _breakout_price(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전일 변동폭과 돌파 가격 계산 (행 방향 이동, 1차원/2차원 공통)
 
-        # 돌파 가격 = 전일 종가 + (전일 변동폭 × breakout_ratio)
-        df['Breakout_Price'] = df['Close'].shift(1) + (df['Prev_Range'] * self.breakout_ratio)
+        Args:
+            close: 종가 배열
+            high: 고가 배열
+            low: 저가 배열
 
-        # 시그널 초기화
-        df['Signal'] = 0
-        df['Entry_Price'] = 0.0
+        Returns:
+            tuple: (전일 변동폭, 돌파 가격) 배열 (첫날은 NaN)
+        """
+        prev_close, prev_range = self._previous_bar(close, high, low)
 
-        # 매수 진입 가격 추적
-        in_position = False
-        entry_price = 0
+        # 돌파 가격 = 전일 종가 + (전일 변동폭 × breakout_ratio)
+        return prev_range, prev_close + (prev_range * self.breakout_ratio)
+
+    @staticmethod
+    def _previous_bar(
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전일 종가와 전일 변동폭 (첫날은 NaN)
 
-        for idx in df.index:
-            current_price = df.loc[idx, 'Close']
-            breakout_price = df.loc[idx, 'Breakout_Price']
+        Args:
+            close: 종가 배열
+            high: 고가 배열
+            low: 저가 배열
 
-            if not in_position:
-                # 돌파 시 매수
-                if current_price > breakout_price and not pd.isna(breakout_price):
-                    df.loc[idx, 'Signal'] = 1
-                    entry_price = current_price
-                    df.loc[idx, 'Entry_Price'] = entry_price
-                    in_position = True
-            else:
-                df.loc[idx, 'Entry_Price'] = entry_price
+        Returns:
+            tuple: (전일 종가, 전일 변동폭) 배열
+        """
+        prev_range = np.full(close.shape, np.nan)
+        prev_range[1:] = (high - low)[:-1]
+        prev_close = np.full(close.shape, np.nan)
+        prev_close[1:] = close[:-1]
+        return prev_close, prev_range
+
+    @classmethod
+    def sweep(
+        cls,
+        data: pd.DataFrame,
+        breakout_ratios: Sequence[float],
+        profit_targets: Sequence[float],
+        stop_losses: Sequence[float]
+    ) -> Dict[str, np.ndarray]:
+        """
+        돌파 비율 × 목표 수익률 × 손절 기준 파라미터 그리드를 한 번의 병렬 커널 호출로 실행
 
-                # 수익률 계산
-                profit_pct = ((current_price - entry_price) / entry_price) * 100
+        조합마다 전략 인스턴스를 만들어 generate_signals를 반복 호출하는 대신
+        모든 조합을 numba prange로 병렬 처리
 
-                # 목표 수익률 도달 또는 손절
-                if profit_pct >= self.profit_target or profit_pct <= -self.stop_loss:
-                    df.loc[idx, 'Signal'] = -1
-                    in_position = False
-                    entry_price = 0
+        Args:
+            data: OHLCV 데이터프레임
+            breakout_ratios: 돌파 비율 후보 목록
+            profit_targets: 목표 수익률 후보 목록 (%)
+            stop_losses: 손절 기준 후보 목록 (%)
 
-        return df
+        Returns:
+            dict: 조합별 파라미터 배열('breakout_ratio', 'profit_target', 'stop_loss')과
+                  (조합 수, 행 수) 형태의 결과 배열('Signal', 'Entry_Price')
+        """
+        close, _, _ = cls._prepare(data)
+        prev_close, prev_range = cls._previous_bar(
+            close, as_f64(data['High']), as_f64(data['Low'])
+        )
+
+        # 파라미터 그리드 (모든 조합)
+        grid_ratio, grid_profit, grid_stop = (
+            values.ravel() for values in np.meshgrid(
+                np.asarray(breakout_ratios, dtype=np.float64),
+                np.asarray(profit_targets, dtype=np.float64),
+                np.asarray(stop_losses, dtype=np.float64),
+                indexing='ij'
+            )
+        )
+
+        signal, entry_price = _volatility_breakout_grid(
+            close, prev_close, prev_range, grid_ratio, grid_profit, grid_stop
+        )
+
+        return {
+            'breakout_ratio': grid_ratio,
+            'profit_target': grid_profit,
+            'stop_loss': grid_stop,
+            'Signal': signal,
+            'Entry_Price': entry_price
+        }
+
+    def generate_signals_2d(self, close: np.ndarray, **ohlc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (행 수, 종목 수) 가격 배열의 시그널 생성 (종목 단위 병렬 커널)
 
+        Args:
+            close: 종가 2차원 배열 (행 = 시점, 열 = 종목)
+            **ohlc: High, Low 2차원 배열 (필수)
 
-class CombinedPercentageStrategy(BaseStrategy):
+        Returns:
+            dict: {컬럼명: (행 수, 종목 수) 배열}
+        """
+        close = self._as_2d(close)
+        missing = [name for name in ('High', 'Low') if name not in ohlc]
+        if missing:
+            raise ValueError(f"Missing price arrays: {missing}")
+
+        prev_range, breakout_price = self._breakout_price(
+            close, self._as_2d(ohlc['High']), self._as_2d(ohlc['Low'])
+        )
+
+        # 종목별 구간을 이어 붙인 (종목 수 × 행 수) 배열로 커널 실행
+        n, n_symbols = close.shape
+        offsets = np.arange(n_symbols + 1, dtype=np.int64) * n
+        signal, entry_price = _volatility_breakout_multi(
+            np.ascontiguousarray(close.T).ravel(),
+            np.ascontiguousarray(breakout_price.T).ravel(),
+            offsets,
+            float(self.profit_target),
+            float(self.stop_loss)
+        )
+
+        return {
+            'Prev_Range': prev_range,
+            'Breakout_Price': breakout_price,
+            'Signal': signal.reshape(n_symbols, n).T,
+            'Entry_Price': entry_price.reshape(n_symbols, n).T
+        }
+
+
+class CombinedPercentageStrategy(_PriceChangeStrategy):
     """
     복합 퍼센트 전략
     여러 하락/상승 구간에서 각각 다른 액션
     """
 
+    NAME_FORMAT = "CombinedPct"
+
     def __init__(
         self,
         buy_conditions: List[Tuple[float, float]] = None,
         sell_conditions: List[Tuple[float, float]] = None,
-        lookback_days: int = 1
+        lookback_days: int = 1,
+        keep_intermediate: bool = True
     ):
         """
         CombinedPercentageStrategy 초기화
@@ -364,52 +635,56 @@ class CombinedPercentageStrategy(BaseStrategy):
             buy_conditions: [(하락률, 매수비중), ...] 예: [(3, 0.3), (7, 0.7)]
             sell_conditions: [(상승률, 매도비중), ...] 예: [(5, 0.5), (10, 1.0)]
             lookback_days: 기준 가격 lookback 기간
+            keep_intermediate: Reference_Price/Price_Change_Pct 컬럼 출력 여부
         """
         if buy_conditions is None:
             buy_conditions = [(3.0, 0.3), (7.0, 0.7)]
         if sell_conditions is None:
             sell_conditions = [(5.0, 0.5), (10.0, 1.0)]
 
-        super().__init__(name="CombinedPct")
+        super().__init__()
         self.buy_conditions = sorted(buy_conditions, key=lambda x: x[0], reverse=True)
         self.sell_conditions = sorted(sell_conditions, key=lambda x: x[0])
         self.lookback_days = lookback_days
+        self.keep_intermediate = keep_intermediate
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        # 매도 조건 searchsorted용 배열 (상승률 오름차순)
+        self._sell_rises = np.array([rise_pct for rise_pct, _ in self.sell_conditions], dtype=np.float64)
+        self._sell_sizes = np.array([size for _, size in self.sell_conditions], dtype=np.float32)
+
+    def _signal_columns(self, pct: np.ndarray) -> Dict[str, np.ndarray]:
         """
         복합 퍼센트 시그널 생성
 
         Args:
-            data: OHLCV 데이터프레임
+            pct: 변동률 배열 (%)
 
         Returns:
-            DataFrame: 시그널이 추가된 데이터프레임
+            dict: Signal, Position_Size 컬럼
         """
-        df = data.copy()
-
-        # 기준 가격
-        df['Reference_Price'] = df['Close'].shift(self.lookback_days)
-
-        # 변동률 계산
-        df['Price_Change_Pct'] = ((df['Close'] - df['Reference_Price']) / df['Reference_Price']) * 100
-
-        # 시그널 초기화
-        df['Signal'] = 0
-        df['Position_Size'] = 0.0
+        position_size = np.zeros(pct.shape, dtype=np.float32)
+
+        # 매수: 하락률 내림차순 목록에서 나중 조건이 우선하므로,
+        # 어느 조건이든 충족되면 (= 가장 작은 하락률 도달) 마지막 조건의 비중 적용
+        if self.buy_conditions:
+            min_drop, last_size = self.buy_conditions[-1]
+            buy_mask = pct <= -min_drop
+            position_size[buy_mask] = last_size
+        else:
+            buy_mask = np.zeros(pct.shape, dtype=bool)
 
-        # 매수 조건 체크
-        for drop_pct, buy_size in self.buy_conditions:
-            mask = df['Price_Change_Pct'] <= -drop_pct
-            df.loc[mask, 'Signal'] = 1
-            df.loc[mask, 'Position_Size'] = buy_size
+        # 매도: 도달한 가장 높은 상승률 조건의 비중 적용 (매수보다 우선)
+        level = _triggered_level_count(self._sell_rises, pct)
+        sell_mask = level > 0
+        position_size[sell_mask] = self._sell_sizes[level[sell_mask] - 1]
 
-        # 매도 조건 체크
-        for rise_pct, sell_size in self.sell_conditions:
-            mask = df['Price_Change_Pct'] >= rise_pct
-            df.loc[mask, 'Signal'] = -1
-            df.loc[mask, 'Position_Size'] = sell_size
+        signal = np.select(
+            [sell_mask, buy_mask],
+            [self.SELL, self.BUY],
+            default=self.HOLD
+        )
 
-        return df
+        return {'Signal': signal, 'Position_Size': position_size}
 
 
 class DailyDCAStrategy(BaseStrategy):
@@ -425,8 +700,18 @@ class DailyDCAStrategy(BaseStrategy):
       - 큰 하락 시 더 많이 사서 평균 단가 빠르게 낮춤
 
     매도: 각 회차별로 3% 이상 수익난 포지션만 개별 매도
+
+    Buy_Condition 컬럼은 int8 코드로 기록 (문자열은 buy_condition_str로 변환)
     """
 
+    NAME_FORMAT = "DailyDCA({max_positions}회)"
+
+    # Buy_Condition 코드
+    BUY_NONE = BUY_NONE
+    BUY_FIRST_DAY = BUY_FIRST_DAY
+    BUY_DAILY_DROP = BUY_DAILY_DROP
+    BUY_PULLBACK = BUY_PULLBACK
+
     def __init__(
         self,
         max_positions: int = 10,
@@ -437,7 +722,8 @@ class DailyDCAStrategy(BaseStrategy):
         position_scaling: bool = True,
         base_quantity: int = 1,
         depth_threshold: float = 5.0,
-        max_quantity_multiplier: int = 5
+        max_quantity_multiplier: int = 5,
+        detail_columns: bool = True
     ):
         """
         DailyDCAStrategy 초기화
@@ -452,8 +738,9 @@ class DailyDCAStrategy(BaseStrategy):
             base_quantity: 기본 매수 수량
             depth_threshold: 하락 몇%마다 수량 증가
             max_quantity_multiplier: 최대 수량 배수
+            detail_columns: 보유 상태 컬럼(Position_Count, Total_Quantity, Sell_Count) 출력 여부
         """
-        super().__init__(name=f"DailyDCA({max_positions}회)")
+        super().__init__()
         self.max_positions = max_positions
         self.profit_target_percent = profit_target_percent
         self.first_day_buy = first_day_buy
@@ -463,25 +750,50 @@ class DailyDCAStrategy(BaseStrategy):
         self.base_quantity = base_quantity
         self.depth_threshold = depth_threshold
         self.max_quantity_multiplier = max_quantity_multiplier
+        self.detail_columns = detail_columns
 
     def _calculate_quantity(self, drop_from_avg: float) -> int:
         """
         평균 매수가 대비 하락 깊이에 따른 매수 수량 계산
 
+        상태 머신 커널과 같은 구현(_scaled_quantity)을 사용
+
         Args:
             drop_from_avg: 평균 매수가 대비 하락률 (%)
 
         Returns:
             int: 매수할 수량
         """
-        if not self.position_scaling:
-            return self.base_quantity
+        return int(_scaled_quantity(
+            float(drop_from_avg),
+            bool(self.position_scaling),
+            int(self.base_quantity),
+            float(self.depth_threshold),
+            int(self.max_quantity_multiplier)
+        ))
+
+    @staticmethod
+    def buy_condition_str(signals: pd.DataFrame) -> pd.Series:
+        """
+        Buy_Condition 코드를 문자열로 변환 (리포트/출력용)
 
-        # 평균 매수가 대비 하락 깊이에 따라 배수 증가
-        multiplier = 1 + int(drop_from_avg / self.depth_threshold)
-        multiplier = min(multiplier, self.max_quantity_multiplier)
+        Args:
+            signals: generate_signals 결과 데이터프레임
 
-        return self.base_quantity * multiplier
+        Returns:
+            Series: 매수 조건 문자열 ('', 'First_Day', 'Daily_Drop', 'Pullback_x.x%')
+        """
+        buy_condition = signals['Buy_Condition'].to_numpy()
+        drop_from_high = signals['Drop_From_High'].to_numpy()
+
+        labels = np.full(len(buy_condition), '', dtype=object)
+        labels[buy_condition == BUY_FIRST_DAY] = 'First_Day'
+        labels[buy_condition == BUY_DAILY_DROP] = 'Daily_Drop'
+
+        pullback = np.flatnonzero(buy_condition == BUY_PULLBACK)
+        labels[pullback] = [f'Pullback_{drop:.1f}%' for drop in drop_from_high[pullback]]
+
+        return pd.Series(labels, index=signals.index, name='Buy_Condition')
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -493,103 +805,214 @@ class DailyDCAStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
-        # 전일 종가
-        df['Prev_Close'] = df['Close'].shift(1)
-
-        # 최근 N일 최고가 (트레일링 매수용)
-        df['Recent_High'] = df['Close'].rolling(window=self.lookback_days, min_periods=1).max()
-
-        # 시그널 초기화
-        df['Signal'] = 0
-        df['Position_Count'] = 0
-        df['Total_Quantity'] = 0  # 총 보유 수량
-        df['Sell_Count'] = 0  # 매도한 회차 수
-        df['Buy_Quantity'] = 0  # 매수한 수량
-        df['Buy_Condition'] = ''  # 매수 조건 추적
-
-        # 상태 추적: 각 회차별 (매수가, 수량) 튜플 리스트
-        buy_positions = []
-
-        for idx in df.index:
-            current_close = df.loc[idx, 'Close']
-            prev_close = df.loc[idx, 'Prev_Close']
-            recent_high = df.loc[idx, 'Recent_High']
-
-            sell_count = 0
-
-            # 첫날 처리
-            if pd.isna(prev_close):
-                if self.first_day_buy:
-                    quantity = self.base_quantity
-                    df.loc[idx, 'Signal'] = 1
-                    df.loc[idx, 'Buy_Condition'] = 'First_Day'
-                    df.loc[idx, 'Buy_Quantity'] = quantity
-                    buy_positions.append((current_close, quantity))
-            else:
-                # 매수 조건 체크
-                should_buy = False
-                buy_reason = ''
-
-                # 조건 1: 전일 종가보다 하락
-                if current_close < prev_close:
-                    should_buy = True
-                    buy_reason = 'Daily_Drop'
-
-                # 조건 2: 최근 고점 대비 일정 % 하락 (상승장 대응)
-                if not pd.isna(recent_high) and recent_high > 0:
-                    drop_from_high = ((recent_high - current_close) / recent_high) * 100
-                    if drop_from_high >= self.pullback_percent:
-                        should_buy = True
-                        buy_reason = f'Pullback_{drop_from_high:.1f}%'
-
-                # 매수 실행
-                if should_buy and len(buy_positions) < self.max_positions:
-                    # 평균 매수가 대비 하락률 계산 (스케일링용)
-                    if len(buy_positions) > 0:
-                        # 현재 보유 포지션의 평균 매수가 계산
-                        total_cost = sum(price * qty for price, qty in buy_positions)
-                        total_quantity = sum(qty for _, qty in buy_positions)
-                        avg_price = total_cost / total_quantity if total_quantity > 0 else current_close
-
-                        # 평균가 대비 하락률
-                        drop_from_avg = ((avg_price - current_close) / avg_price) * 100
-                    else:
-                        drop_from_avg = 0.0
-
-                    # 평균 매수가 대비 하락 깊이에 따른 수량 계산
-                    quantity = self._calculate_quantity(drop_from_avg)
-
-                    df.loc[idx, 'Signal'] = 1
-                    df.loc[idx, 'Buy_Condition'] = buy_reason
-                    df.loc[idx, 'Buy_Quantity'] = quantity
-                    buy_positions.append((current_close, quantity))
-
-                # 매도 조건: 전일보다 상승 + 수익난 회차 있음
-                elif current_close > prev_close and len(buy_positions) > 0:
-                    # 상승: 회차별 익절 체크
-                    remaining_positions = []
-                    total_sell_quantity = 0
-
-                    for buy_price, quantity in buy_positions:
-                        profit_pct = ((current_close - buy_price) / buy_price) * 100
-
-                        if profit_pct >= self.profit_target_percent:
-                            # 이 회차는 매도
-                            sell_count += 1
-                            total_sell_quantity += quantity
-                        else:
-                            # 이 회차는 유지
-                            remaining_positions.append((buy_price, quantity))
-
-                    if sell_count > 0:
-                        df.loc[idx, 'Signal'] = -1
-                        df.loc[idx, 'Sell_Count'] = sell_count
-                        buy_positions = remaining_positions
-
-            # 현재 상태 기록
-            df.loc[idx, 'Position_Count'] = len(buy_positions)
-            df.loc[idx, 'Total_Quantity'] = sum(qty for _, qty in buy_positions)
-
-        return df
+        close, _, _ = self._prepare(data)
+
+        # 최근 N일 최고가 (트레일링 매수용, 같은 종가/기간은 캐시 공유)
+        recent_high = rolling_max(close, self.lookback_days)
+
+        # 회차별 (매수가, 수량) 상태 머신은 numba 커널에서 배열 단위로 처리
+        # (전일 종가는 커널 안에서 close[i - 1]로 직접 참조)
+        results = _daily_dca_loop(close, recent_high, *self._kernel_params())
+
+        return self._output(data, recent_high, results)
+
+    def _kernel_params(self) -> tuple:
+        """
+        상태 머신 커널에 넘길 파라미터 (종가/최고가 배열 뒤에 오는 인자)
+
+        Returns:
+            tuple: 커널 인자 튜플
+        """
+        return (
+            int(self.max_positions),
+            float(self.profit_target_percent),
+            bool(self.first_day_buy),
+            float(self.pullback_percent),
+            bool(self.position_scaling),
+            int(self.base_quantity),
+            float(self.depth_threshold),
+            int(self.max_quantity_multiplier)
+        )
+
+    def _output(self, data: pd.DataFrame, recent_high: np.ndarray, results: tuple) -> pd.DataFrame:
+        """
+        커널 결과 배열을 원본 데이터에 붙임
+
+        Args:
+            data: OHLCV 데이터프레임
+            recent_high: 최근 N일 최고가 배열
+            results: _daily_dca_loop 결과 튜플
+
+        Returns:
+            DataFrame: 시그널이 추가된 데이터프레임
+        """
+        # 결과 컬럼을 한 번에 붙여 단편화 방지
+        return self._attach_columns(data, self._output_columns(recent_high, results))
+
+    def _output_columns(self, recent_high: np.ndarray, results: tuple) -> Dict[str, np.ndarray]:
+        """
+        커널 결과 배열로 출력 컬럼 구성 (detail_columns가 False면 보유 상태 컬럼 생략)
+
+        Args:
+            recent_high: 최근 N일 최고가 배열
+            results: _daily_dca_loop 결과 튜플
+
+        Returns:
+            dict: {컬럼명: 배열}
+        """
+        (
+            signal, position_count, total_quantity, sell_count,
+            buy_quantity, buy_condition, drop_from_high
+        ) = results
+
+        columns = {
+            'Recent_High': recent_high,
+            'Signal': signal,
+            'Position_Count': position_count,
+            'Total_Quantity': total_quantity,  # 총 보유 수량
+            'Sell_Count': sell_count,  # 매도한 회차 수
+            'Buy_Quantity': buy_quantity,  # 매수한 수량
+            'Buy_Condition': buy_condition,  # 매수 조건 코드 (BUY_* 상수)
+            'Drop_From_High': drop_from_high  # 매수일의 고점 대비 하락률 (%)
+        }
+
+        # 보유 상태 컬럼이 필요 없으면 출력하지 않음
+        if not self.detail_columns:
+            for column in ('Position_Count', 'Total_Quantity', 'Sell_Count'):
+                del columns[column]
+
+        return columns
+
+    def generate_signals_parallel(
+        self,
+        panel_dict: Dict[str, pd.DataFrame],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        종목별 데이터프레임의 시그널을 하나의 병렬 커널로 생성
+
+        종목별 종가를 이어 붙여 _daily_dca_multi에서 종목 단위 prange로 처리.
+        병렬 스레드 수는 numba 설정(NUMBA_NUM_THREADS)을 따르므로 max_workers는 사용하지 않음
+
+        Args:
+            panel_dict: {종목: OHLCV 데이터프레임} 딕셔너리
+            max_workers: 기본 구현과의 호환용 (사용하지 않음)
+
+        Returns:
+            dict: {종목: 시그널이 추가된 데이터프레임} (입력과 같은 순서)
+        """
+        if not panel_dict:
+            return {}
+
+        closes = [self._prepare(data)[0] for data in panel_dict.values()]
+        highs = [rolling_max(close, self.lookback_days) for close in closes]
+
+        offsets = np.zeros(len(closes) + 1, dtype=np.int64)
+        np.cumsum([close.shape[0] for close in closes], out=offsets[1:])
+
+        results = _daily_dca_multi(
+            np.concatenate(closes),
+            np.concatenate(highs),
+            offsets,
+            *self._kernel_params()
+        )
+
+        output = {}
+        for k, (symbol, data) in enumerate(panel_dict.items()):
+            start, stop = offsets[k], offsets[k + 1]
+            output[symbol] = self._output(
+                data, highs[k], tuple(values[start:stop] for values in results)
+            )
+        return output
+
+    def generate_signals_2d(self, close: np.ndarray, **ohlc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (행 수, 종목 수) 종가 배열의 시그널 생성 (종목 단위 병렬 커널)
+
+        Args:
+            close: 종가 2차원 배열 (행 = 시점, 열 = 종목)
+            **ohlc: 사용하지 않음 (기본 구현과의 호환용)
+
+        Returns:
+            dict: {컬럼명: (행 수, 종목 수) 배열}
+        """
+        # 종목별 행을 이어 붙인 (종목 수 × 행 수) 배열
+        closes = np.ascontiguousarray(self._as_2d(close).T)
+        n_symbols, n = closes.shape
+
+        highs = np.empty_like(closes)
+        for k in range(n_symbols):
+            highs[k] = rolling_max(closes[k], self.lookback_days)
+
+        offsets = np.arange(n_symbols + 1, dtype=np.int64) * n
+        results = _daily_dca_multi(
+            closes.ravel(), highs.ravel(), offsets, *self._kernel_params()
+        )
+
+        return self._output_columns(
+            highs.T, tuple(values.reshape(n_symbols, n).T for values in results)
+        )
+
+    @classmethod
+    def sweep(
+        cls,
+        data: pd.DataFrame,
+        max_positions: Sequence[int],
+        profit_target_percents: Sequence[float],
+        **kwargs
+    ) -> Dict[str, np.ndarray]:
+        """
+        최대 회차 × 익절 기준 파라미터 그리드를 한 번의 병렬 커널 호출로 실행
+
+        조합마다 전략 인스턴스를 만들어 generate_signals를 반복 호출하는 대신
+        모든 조합을 numba prange로 병렬 처리
+
+        Args:
+            data: OHLCV 데이터프레임
+            max_positions: 최대 매수 회차 후보 목록
+            profit_target_percents: 익절 기준 후보 목록 (%)
+            **kwargs: 나머지 고정 파라미터 (first_day_buy, lookback_days 등)
+
+        Returns:
+            dict: 조합별 파라미터 배열('max_positions', 'profit_target_percent')과
+                  (조합 수, 행 수) 형태의 결과 배열('Signal', 'Position_Count',
+                  'Total_Quantity', 'Sell_Count', 'Buy_Quantity')
+        """
+        strategy = cls(**kwargs)
+
+        close, _, _ = strategy._prepare(data)
+        recent_high = rolling_max(close, strategy.lookback_days)
+
+        # 파라미터 그리드 (모든 조합)
+        grid_max, grid_profit = np.meshgrid(
+            np.asarray(max_positions, dtype=np.int64),
+            np.asarray(profit_target_percents, dtype=np.float64),
+            indexing='ij'
+        )
+        grid_max = grid_max.ravel()
+        grid_profit = grid_profit.ravel()
+
+        (
+            signal, position_count, total_quantity, sell_count, buy_quantity
+        ) = _daily_dca_grid(
+            close,
+            recent_high,
+            grid_max,
+            grid_profit,
+            bool(strategy.first_day_buy),
+            float(strategy.pullback_percent),
+            bool(strategy.position_scaling),
+            int(strategy.base_quantity),
+            float(strategy.depth_threshold),
+            int(strategy.max_quantity_multiplier)
+        )
+
+        return {
+            'max_positions': grid_max,
+            'profit_target_percent': grid_profit,
+            'Signal': signal,
+            'Position_Count': position_count,
+            'Total_Quantity': total_quantity,
+            'Sell_Count': sell_count,
+            'Buy_Quantity': buy_quantity
+        }
@@ -4,8 +4,11 @@ RSI 전략
 """
 
 import pandas as pd
+import numpy as np
+from typing import Dict
 from .base_strategy import BaseStrategy
 from ..utils.indicators import TechnicalIndicators
+from ..utils._indicator_cache import rolling_max, rolling_min
 
 
 class RSIStrategy(BaseStrategy):
@@ -14,12 +17,15 @@ class RSIStrategy(BaseStrategy):
     RSI가 과매도 구간에서 매수, 과매수 구간에서 매도
     """
 
+    NAME_FORMAT = "RSI({period})"
+
     def __init__(
         self,
         period: int = 14,
         oversold: int = 30,
         overbought: int = 70,
-        neutral_zone: tuple = (40, 60)
+        neutral_zone: tuple = (40, 60),
+        smoothing: str = 'sma'
     ):
         """
         RSIStrategy 초기화
@@ -29,12 +35,14 @@ class RSIStrategy(BaseStrategy):
             oversold: 과매도 임계값
             overbought: 과매수 임계값
             neutral_zone: 중립 구간 (청산 신호)
+            smoothing: RSI 평활 방식 ('sma' 또는 'wilder')
         """
-        super().__init__(name=f"RSI({period})")
+        super().__init__()
         self.period = period
         self.oversold = oversold
         self.overbought = overbought
         self.neutral_zone = neutral_zone
+        self.smoothing = smoothing
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -46,27 +54,56 @@ class RSIStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
-
         # RSI 계산
-        df['RSI'] = TechnicalIndicators.calculate_rsi(df['Close'], self.period)
+        rsi = TechnicalIndicators.calculate_rsi(data['Close'], self.period, self.smoothing)
 
-        # 시그널 초기화
-        df['Signal'] = 0
+        return self._attach_columns(data, {
+            'RSI': rsi,
+            'Signal': self._rsi_signal(rsi.to_numpy())
+        })
 
-        # 과매도 구간: 매수 신호
-        df.loc[df['RSI'] < self.oversold, 'Signal'] = 1
+    def _rsi_signal(self, rsi_values: np.ndarray) -> np.ndarray:
+        """
+        RSI 값으로 시그널 계산 (1차원/2차원 공통)
 
-        # 과매수 구간: 매도 신호
-        df.loc[df['RSI'] > self.overbought, 'Signal'] = -1
+        Args:
+            rsi_values: RSI 배열
 
-        # 중립 구간: 포지션 청산
+        Returns:
+            ndarray: Signal 배열 (int8)
+        """
+        # 중립 구간: 포지션 청산 (과매수/과매도보다 우선)
         if self.neutral_zone:
             neutral_low, neutral_high = self.neutral_zone
-            neutral = (df['RSI'] >= neutral_low) & (df['RSI'] <= neutral_high)
-            df.loc[neutral, 'Signal'] = 0
+            neutral = (rsi_values >= neutral_low) & (rsi_values <= neutral_high)
+        else:
+            neutral = np.zeros(rsi_values.shape, dtype=bool)
+
+        # 과매수 구간: 매도 신호 (과매도보다 우선), 과매도 구간: 매수 신호
+        return np.select(
+            [neutral, rsi_values > self.overbought, rsi_values < self.oversold],
+            [self.HOLD, self.SELL, self.BUY],
+            default=self.HOLD
+        )
+
+    def generate_signals_2d(self, close: np.ndarray, **ohlc: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (행 수, 종목 수) 종가 배열의 시그널을 한 번에 생성
+
+        RSI는 DataFrame 열 단위 rolling으로 종목 전체를 한 번에 계산
 
-        return df
+        Args:
+            close: 종가 2차원 배열 (행 = 시점, 열 = 종목)
+            **ohlc: 사용하지 않음 (기본 구현과의 호환용)
+
+        Returns:
+            dict: {컬럼명: (행 수, 종목 수) 배열}
+        """
+        rsi = TechnicalIndicators.calculate_rsi(
+            pd.DataFrame(self._as_2d(close)), self.period, self.smoothing
+        ).to_numpy(dtype=np.float64)
+
+        return {'RSI': rsi, 'Signal': self._rsi_signal(rsi)}
 
 
 class RSIDivergenceStrategy(BaseStrategy):
@@ -75,10 +112,13 @@ class RSIDivergenceStrategy(BaseStrategy):
     가격과 RSI의 괴리를 이용한 전략
     """
 
+    NAME_FORMAT = "RSI_Divergence({period})"
+
     def __init__(
         self,
         period: int = 14,
-        lookback: int = 5
+        lookback: int = 5,
+        smoothing: str = 'sma'
     ):
         """
         RSIDivergenceStrategy 초기화
@@ -86,10 +126,12 @@ class RSIDivergenceStrategy(BaseStrategy):
         Args:
             period: RSI 계산 기간
             lookback: 다이버전스 확인 기간
+            smoothing: RSI 평활 방식 ('sma' 또는 'wilder')
         """
-        super().__init__(name=f"RSI_Divergence({period})")
+        super().__init__()
         self.period = period
         self.lookback = lookback
+        self.smoothing = smoothing
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -101,32 +143,42 @@ class RSIDivergenceStrategy(BaseStrategy):
         Returns:
             DataFrame: 시그널이 추가된 데이터프레임
         """
-        df = data.copy()
+        close, n, _ = self._prepare(data)
 
         # RSI 계산
-        df['RSI'] = TechnicalIndicators.calculate_rsi(df['Close'], self.period)
-
-        # 가격 및 RSI의 최근 고점/저점
-        df['Price_High'] = df['Close'].rolling(window=self.lookback).max()
-        df['Price_Low'] = df['Close'].rolling(window=self.lookback).min()
-        df['RSI_High'] = df['RSI'].rolling(window=self.lookback).max()
-        df['RSI_Low'] = df['RSI'].rolling(window=self.lookback).min()
-
-        # 시그널 초기화
-        df['Signal'] = 0
+        rsi = TechnicalIndicators.calculate_rsi(data['Close'], self.period, self.smoothing)
+        rsi_values = rsi.to_numpy(dtype=np.float64)
+
+        # 가격 및 RSI의 최근 고점/저점 (창 안에 NaN이 있으면 NaN, pandas rolling과 동일)
+        window = self.lookback
+        price_high = rolling_max(close, window, window)
+        price_low = rolling_min(close, window, window)
+        rsi_high = rolling_max(rsi_values, window, window)
+        rsi_low = rolling_min(rsi_values, window, window)
+
+        # lookback 이전의 RSI 고점/저점 (앞쪽은 NaN)
+        prev_rsi_high = np.full(n, np.nan)
+        prev_rsi_low = np.full(n, np.nan)
+        if 0 < window < n:
+            prev_rsi_high[window:] = rsi_high[:-window]
+            prev_rsi_low[window:] = rsi_low[:-window]
 
         # 강세 다이버전스: 가격은 저점 낮아지는데 RSI는 저점 높아짐 (매수)
-        bullish_div = (
-            (df['Close'] == df['Price_Low']) &
-            (df['RSI'] > df['RSI_Low'].shift(self.lookback))
-        )
-        df.loc[bullish_div, 'Signal'] = 1
-
-        # 약세 다이버전스: 가격은 고점 높아지는데 RSI는 고점 낮아짐 (매도)
-        bearish_div = (
-            (df['Close'] == df['Price_High']) &
-            (df['RSI'] < df['RSI_High'].shift(self.lookback))
+        # 약세 다이버전스: 가격은 고점 높아지는데 RSI는 고점 낮아짐 (매도, 매수보다 우선)
+        bullish_div = (close == price_low) & (rsi_values > prev_rsi_low)
+        bearish_div = (close == price_high) & (rsi_values < prev_rsi_high)
+
+        signal = np.select(
+            [bearish_div, bullish_div],
+            [self.SELL, self.BUY],
+            default=self.HOLD
         )
-        df.loc[bearish_div, 'Signal'] = -1
 
-        return df
+        return self._attach_columns(data, {
+            'RSI': rsi,
+            'Price_High': price_high,
+            'Price_Low': price_low,
+            'RSI_High': rsi_high,
+            'RSI_Low': rsi_low,
+            'Signal': signal
+        })
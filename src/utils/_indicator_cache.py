@@ -0,0 +1,263 @@
+"""
+지표 계산 결과 캐시
+같은 가격 배열에 대해 여러 전략이 동일한 지표를 반복 계산하지 않도록
+배열 내용 해시를 키로 하는 LRU 캐시 제공
+
+캐시는 결과 수(CACHE_SIZE)와 전체 바이트 수(CACHE_MAX_BYTES)로 제한됨.
+대량 백테스트/스윕이 끝난 뒤 메모리를 바로 돌려받으려면 clear_cache() 호출
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._indicator_kernels import _rolling_mean_std, _rolling_max, _ema
+from ._njit import NUMBA_AVAILABLE
+
+
+# 캐시에 보관할 최대 결과 수
+CACHE_SIZE = 128
+
+# 캐시에 보관할 결과 배열의 최대 총 바이트 수 (이보다 큰 결과는 캐시하지 않음)
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+_cache_nbytes = 0
+_lock = threading.Lock()
+
+
+def array_key(values: np.ndarray) -> tuple:
+    """
+    배열 내용 기반 캐시 키 생성
+
+    메모리 주소가 아닌 내용 해시를 사용하므로 해제된 배열의 주소가
+    재사용되더라도 잘못된 결과를 반환하지 않음
+
+    Args:
+        values: 1차원 배열
+
+    Returns:
+        tuple: (길이, 내용 해시)
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    digest = hashlib.blake2b(values.data, digest_size=16).digest()
+    return (values.shape[0], digest)
+
+
+def cached(key: tuple, compute: Callable[[], Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+    """
+    캐시에서 결과를 찾고, 없으면 계산하여 저장
+
+    캐시된 배열은 여러 호출자가 공유하므로 읽기 전용으로 설정됨.
+    결과 수가 CACHE_SIZE를, 총 바이트 수가 CACHE_MAX_BYTES를 넘으면
+    오래된 결과부터 제거
+
+    Args:
+        key: 캐시 키
+        compute: 결과 배열 튜플을 반환하는 함수
+
+    Returns:
+        tuple: 결과 배열 튜플
+    """
+    global _cache_nbytes
+
+    with _lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+            return result
+
+    result = compute()
+    for values in result:
+        values.setflags(write=False)
+
+    nbytes = sum(values.nbytes for values in result)
+    if nbytes > CACHE_MAX_BYTES:
+        return result
+
+    with _lock:
+        previous = _cache.pop(key, None)
+        if previous is not None:
+            _cache_nbytes -= sum(values.nbytes for values in previous)
+        _cache[key] = result
+        _cache_nbytes += nbytes
+        while len(_cache) > CACHE_SIZE or _cache_nbytes > CACHE_MAX_BYTES:
+            _, evicted = _cache.popitem(last=False)
+            _cache_nbytes -= sum(values.nbytes for values in evicted)
+
+    return result
+
+
+def clear_cache() -> None:
+    """
+    캐시 비우기
+
+    캐시는 입력 데이터가 삭제된 뒤에도 결과 배열을 (최대 CACHE_MAX_BYTES까지) 유지하므로,
+    대량 종목의 generate_signals_parallel / sweep / Backtester.run 이후
+    메모리를 즉시 해제하려면 호출
+    """
+    global _cache_nbytes
+
+    with _lock:
+        _cache.clear()
+        _cache_nbytes = 0
+
+
+def span_alphas(periods: Sequence[int]) -> np.ndarray:
+    """
+    EMA 기간(span)을 pandas ewm과 같은 방식으로 평활 계수로 변환
+
+    Args:
+        periods: EMA 기간 목록
+
+    Returns:
+        ndarray: 기간별 평활 계수 배열
+    """
+    return np.array(
+        [1.0 / (1.0 + (period - 1) / 2.0) for period in periods], dtype=np.float64
+    )
+
+
+def rolling_mean_std(values: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이동평균 및 이동표준편차 (캐시 사용)
+
+    ZScore 전략과 볼린저 밴드가 같은 종가/기간에 대해 결과를 공유.
+    계산은 단일 패스 numba 커널(_rolling_mean_std)로 수행
+
+    Args:
+        values: 가격 배열
+        period: 이동 기간
+
+    Returns:
+        tuple: (이동평균, 이동표준편차) 배열
+    """
+    def compute():
+        return _rolling_mean_std(
+            np.ascontiguousarray(values, dtype=np.float64), int(period)
+        )
+
+    return cached(('rolling_mean_std', array_key(values), period), compute)
+
+
+def macd_lines(
+    values: np.ndarray,
+    fast: int,
+    slow: int,
+    signal: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD 라인, 시그널 라인, 히스토그램 (캐시 사용)
+
+    MACD / MACDHistogram / MACDZeroCross 전략이 같은 종가/파라미터에 대해
+    결과를 공유. numba가 설치되어 있고 NaN이 없으면 빠른/느린 EMA를
+    가격 배열 한 번 순회로 계산 (pandas ewm과 결과 동일)
+
+    Args:
+        values: 가격 배열
+        fast: 빠른 EMA 기간
+        slow: 느린 EMA 기간
+        signal: 시그널 라인 기간
+
+    Returns:
+        tuple: (MACD, Signal, Histogram) 배열
+    """
+    def compute():
+        prices = np.ascontiguousarray(values, dtype=np.float64)
+        if NUMBA_AVAILABLE and not np.isnan(prices).any():
+            ema_fast, ema_slow = _ema(prices, span_alphas([fast, slow]))
+            macd = ema_fast - ema_slow
+            signal_line = _ema(macd, span_alphas([signal]))[0]
+            return macd, signal_line, macd - signal_line
+
+        series = pd.Series(prices)
+        ema_fast = series.ewm(span=fast, adjust=False).mean()
+        ema_slow = series.ewm(span=slow, adjust=False).mean()
+
+        macd = ema_fast - ema_slow
+        signal_line = macd.ewm(span=signal, adjust=False).mean()
+        histogram = macd - signal_line
+
+        return macd.to_numpy(), signal_line.to_numpy(), histogram.to_numpy()
+
+    return cached(('macd', array_key(values), fast, slow, signal), compute)
+
+
+def shifted_change_pct(close: np.ndarray, lookback: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    lookback 전 기준 가격과 변동률(%) (캐시 없음)
+
+    행 방향(축 0)으로 이동하므로 (행 수, 종목 수) 2차원 배열은 종목별로 계산됨
+
+    Args:
+        close: float64 가격 배열 (1차원 또는 2차원)
+        lookback: 기준 가격 lookback 기간
+
+    Returns:
+        tuple: (기준 가격, 변동률) 배열
+    """
+    n = close.shape[0]
+
+    # 기준 가격 = lookback만큼 이동한 종가 (pandas shift와 동일, 빈 칸은 NaN)
+    reference = np.full(close.shape, np.nan)
+    if 0 <= lookback < n:
+        reference[lookback:] = close[:n - lookback]
+    elif -n < lookback < 0:
+        reference[:lookback] = close[-lookback:]
+
+    # 임시 배열 없이 제자리 연산. 역수 곱셈은 반올림이 달라져
+    # 임계값 경계의 시그널이 바뀔 수 있으므로 나눗셈을 유지
+    pct = close - reference
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct /= reference
+    pct *= 100
+    return reference, pct
+
+
+def rolling_max(values: np.ndarray, window: int, min_periods: int = 1) -> np.ndarray:
+    """
+    이동 최댓값 (캐시 사용)
+
+    DailyDCA 전략의 파라미터 스윕에서 같은 종가/기간의 최근 고점을 재사용
+
+    Args:
+        values: 가격 배열
+        window: 이동 기간
+        min_periods: 최소 관측치 수
+
+    Returns:
+        ndarray: 이동 최댓값 배열
+    """
+    def compute():
+        return (_rolling_max(
+            np.ascontiguousarray(values, dtype=np.float64), int(window), int(min_periods)
+        ),)
+
+    return cached(('rolling_max', array_key(values), window, min_periods), compute)[0]
+
+
+def rolling_min(values: np.ndarray, window: int, min_periods: int = 1) -> np.ndarray:
+    """
+    이동 최솟값 (캐시 사용)
+
+    부호를 바꾼 배열의 이동 최댓값으로 계산 (부호 반전은 정확하므로 결과 동일)
+
+    Args:
+        values: 가격 배열
+        window: 이동 기간
+        min_periods: 최소 관측치 수
+
+    Returns:
+        ndarray: 이동 최솟값 배열
+    """
+    def compute():
+        negated = -np.ascontiguousarray(values, dtype=np.float64)
+        result = _rolling_max(negated, int(window), int(min_periods))
+        np.negative(result, out=result)
+        return (result,)
+
+    return cached(('rolling_min', array_key(values), window, min_periods), compute)[0]
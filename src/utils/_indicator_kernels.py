@@ -0,0 +1,418 @@
+"""
+기술적 지표용 numba 커널
+pandas rolling 연산을 대체하는 단일 패스 배열 루프
+"""
+
+import math
+
+import numpy as np
+from ._njit import njit
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std(values, window):
+    """
+    이동평균 및 이동표준편차 (ddof=1) 단일 패스 계산
+
+    Welford 방식으로 평균과 제곱편차합(M2)을 값 추가/제거 시마다 갱신하므로
+    합/제곱합 방식보다 가격 수준이 큰 데이터에서 상쇄 오차가 작음.
+    추가/제거 누적 오차가 쌓이지 않도록 window 행마다 현재 창을
+    두 번 순회하여 평균과 M2를 다시 계산함 (행당 상각 비용은 상수).
+    pandas rolling(window).mean()/.std()와 같이 창 안에 NaN이 있거나
+    관측치가 window 미만이면 NaN을 반환. 창 전체가 같은 값이면 pandas와 같이
+    평균은 그 값, 표준편차는 0을 그대로 반환 (누적 연산의 ulp 오차 제거)
+
+    Args:
+        values: 가격 배열 (float64)
+        window: 이동 기간
+
+    Returns:
+        tuple: (이동평균, 이동표준편차) 배열
+    """
+    n = values.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+
+    if window < 1:
+        return mean_out, std_out
+
+    nobs = 0
+    nan_count = 0
+    mean = 0.0
+    m2 = 0.0
+    # 마지막으로 연속된 같은 값과 그 개수 (NaN은 건너뜀, pandas와 동일)
+    prev_value = np.nan
+    same_count = 0
+
+    for i in range(n):
+        # 새 값 추가
+        x = values[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            if x == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+                prev_value = x
+            nobs += 1
+            delta = x - mean
+            mean += delta / nobs
+            m2 += delta * (x - mean)
+
+        # 창 밖으로 나간 값 제거
+        if i >= window:
+            y = values[i - window]
+            if np.isnan(y):
+                nan_count -= 1
+            else:
+                nobs -= 1
+                if nobs > 0:
+                    delta = y - mean
+                    mean -= delta / nobs
+                    m2 -= delta * (y - mean)
+                else:
+                    mean = 0.0
+                    m2 = 0.0
+
+        if i >= window - 1 and nan_count == 0:
+            # 주기적으로 현재 창 기준으로 재계산하여 누적 오차 제거
+            if (i - window + 1) % window == 0:
+                start = i - window + 1
+                total = 0.0
+                for j in range(start, i + 1):
+                    total += values[j]
+                mean = total / window
+                m2 = 0.0
+                for j in range(start, i + 1):
+                    delta = values[j] - mean
+                    m2 += delta * delta
+
+            if same_count >= window:
+                # 창 전체가 같은 값
+                mean_out[i] = prev_value
+                if nobs > 1:
+                    std_out[i] = 0.0
+            else:
+                mean_out[i] = mean
+                if nobs > 1:
+                    std_out[i] = math.sqrt(max(m2, 0.0) / (nobs - 1))
+
+    return mean_out, std_out
+
+
+@njit(cache=True, nogil=True)
+def _ema(values, alphas):
+    """
+    지수 이동평균 (adjust=False) 여러 기간 동시 계산
+
+    pandas ewm(adjust=False).mean()과 같은 점화식
+    y[i] = ((1 - a) * y[i - 1] + a * x[i]) / ((1 - a) + a) 를 사용하므로
+    NaN이 없는 입력에 대해 결과가 일치함. 같은 가격 배열을 한 번만 읽으면서
+    모든 기간의 EMA를 갱신
+
+    Args:
+        values: 가격 배열 (float64, NaN 없음)
+        alphas: 기간별 평활 계수 배열
+
+    Returns:
+        ndarray: (기간 수, 행 수) EMA 배열
+    """
+    n = values.shape[0]
+    m = alphas.shape[0]
+    out = np.empty((m, n))
+
+    if n == 0:
+        return out
+
+    old_weights = np.empty(m)
+    norms = np.empty(m)
+    for k in range(m):
+        old_weights[k] = 1.0 - alphas[k]
+        norms[k] = old_weights[k] + alphas[k]
+        out[k, 0] = values[0]
+
+    for i in range(1, n):
+        x = values[i]
+        for k in range(m):
+            out[k, i] = (old_weights[k] * out[k, i - 1] + alphas[k] * x) / norms[k]
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_max(values, window, min_periods):
+    """
+    이동 최댓값 (단조 감소 덱 사용, 행당 상각 O(1))
+
+    pandas rolling(window, min_periods).max()와 같이 NaN은 건너뛰고,
+    창 안의 유효 관측치가 min_periods 미만이면 NaN을 반환
+
+    Args:
+        values: 가격 배열 (float64)
+        window: 이동 기간
+        min_periods: 최소 관측치 수
+
+    Returns:
+        ndarray: 이동 최댓값 배열
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+
+    if window < 1:
+        return out
+
+    # 덱: 값이 단조 감소하는 인덱스를 링 버퍼로 보관
+    deque = np.empty(window, np.int64)
+    head = 0
+    size = 0
+    nobs = 0
+
+    for i in range(n):
+        x = values[i]
+
+        # 창 밖으로 나간 값 제거
+        if i >= window:
+            if not np.isnan(values[i - window]):
+                nobs -= 1
+            if size > 0 and deque[head] <= i - window:
+                head = (head + 1) % window
+                size -= 1
+
+        if not np.isnan(x):
+            nobs += 1
+            # x 이하인 뒤쪽 값은 더 이상 최댓값이 될 수 없음
+            while size > 0 and values[deque[(head + size - 1) % window]] <= x:
+                size -= 1
+            deque[(head + size) % window] = i
+            size += 1
+
+        if nobs >= min_periods and size > 0:
+            out[i] = values[deque[head]]
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi_wilder(values, period):
+    """
+    Wilder 평활 RSI 단일 패스 계산
+
+    첫 period개 가격 변화의 단순 평균으로 평균 상승/하락폭을 시작한 뒤
+    avg = (avg * (period - 1) + x) / period 로 갱신. 가격 변화가 NaN인 행은
+    NaN을 출력하고 평균 상태는 유지함
+
+    Args:
+        values: 가격 배열 (float64)
+        period: RSI 기간
+
+    Returns:
+        ndarray: RSI 배열 (0-100, 초기 period 행은 NaN)
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+
+    if period < 1:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+
+    for i in range(1, n):
+        delta = values[i] - values[i - 1]
+        if np.isnan(delta):
+            continue
+
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if count < period:
+            # 초기 구간: 단순 평균으로 시작
+            avg_gain += gain
+            avg_loss += loss
+            count += 1
+            if count < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _atr_wilder(high, low, close, period):
+    """
+    Wilder 평활 ATR 단일 패스 계산
+
+    True Range = max(고가 - 저가, |고가 - 전일 종가|, |저가 - 전일 종가|)
+    (첫 행은 고가 - 저가). 첫 period개 TR의 단순 평균으로 시작한 뒤
+    atr = (atr * (period - 1) + tr) / period 로 갱신. TR이 NaN인 행은
+    NaN을 출력하고 평균 상태는 유지함
+
+    Args:
+        high: 고가 배열 (float64)
+        low: 저가 배열 (float64)
+        close: 종가 배열 (float64)
+        period: ATR 기간
+
+    Returns:
+        ndarray: ATR 배열 (초기 period - 1 행은 NaN)
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+
+    if period < 1:
+        return out
+
+    atr = 0.0
+    count = 0
+
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            tr = max(tr, abs(high[i] - prev_close), abs(low[i] - prev_close))
+        if np.isnan(tr):
+            continue
+
+        if count < period:
+            # 초기 구간: 단순 평균으로 시작
+            atr += tr
+            count += 1
+            if count < period:
+                continue
+            atr /= period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+
+        out[i] = atr
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _adx_wilder(high, low, close, period):
+    """
+    Wilder 평활 ADX 단일 패스 계산
+
+    +DM/-DM은 Wilder 정의를 따름 (고가 상승폭과 저가 하락폭 중 큰 쪽만 양수).
+    TR, +DM, -DM을 Wilder 방식으로 평활해 DX를 구하고, 첫 period개 DX의
+    단순 평균으로 ADX를 시작한 뒤 같은 점화식으로 갱신.
+    입력이 NaN인 행은 NaN을 출력하고 평균 상태는 유지함
+
+    Args:
+        high: 고가 배열 (float64)
+        low: 저가 배열 (float64)
+        close: 종가 배열 (float64)
+        period: ADX 기간
+
+    Returns:
+        ndarray: ADX 배열 (초기 2 * period - 1 행은 NaN)
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+
+    if period < 1:
+        return out
+
+    atr = 0.0
+    plus_avg = 0.0
+    minus_avg = 0.0
+    adx = 0.0
+    count = 0
+    dx_count = 0
+
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        prev_close = close[i - 1]
+        tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        if np.isnan(up) or np.isnan(down) or np.isnan(tr):
+            continue
+
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+
+        # TR, +DM, -DM 평활 (초기 구간은 단순 평균)
+        if count < period:
+            atr += tr
+            plus_avg += plus_dm
+            minus_avg += minus_dm
+            count += 1
+            if count < period:
+                continue
+            atr /= period
+            plus_avg /= period
+            minus_avg /= period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+            plus_avg = (plus_avg * (period - 1) + plus_dm) / period
+            minus_avg = (minus_avg * (period - 1) + minus_dm) / period
+
+        # DX = 100 * |+DI - -DI| / (+DI + -DI) (DI의 ATR 분모는 약분됨)
+        di_sum = plus_avg + minus_avg
+        dx = 100.0 * abs(plus_avg - minus_avg) / di_sum if di_sum > 0 else 0.0
+
+        if dx_count < period:
+            adx += dx
+            dx_count += 1
+            if dx_count < period:
+                continue
+            adx /= period
+        else:
+            adx = (adx * (period - 1) + dx) / period
+
+        out[i] = adx
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _compensated_cumsum(values):
+    """
+    보정 합산(Neumaier) 누적합
+
+    각 단계의 반올림 오차를 별도 보정값에 모아 더하므로 긴 배열에서도
+    누적 오차가 데이터 길이에 비례해 커지지 않음. pandas cumsum과 같이
+    NaN은 건너뛰고 해당 행은 NaN을 출력함
+
+    Args:
+        values: 값 배열 (float64)
+
+    Returns:
+        ndarray: 누적합 배열
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+
+    total = 0.0
+    comp = 0.0
+
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            continue
+
+        t = total + x
+        if abs(total) >= abs(x):
+            comp += (total - t) + x
+        else:
+            comp += (x - t) + total
+        total = t
+
+        # 무한대가 들어오면 보정값이 NaN이 되므로 버림
+        if not np.isfinite(comp):
+            comp = 0.0
+
+        out[i] = total + comp
+
+    return out
@@ -0,0 +1,51 @@
+"""
+numba JIT 호환 모듈
+numba가 설치되어 있으면 njit/prange를 그대로 제공하고,
+설치되어 있지 않으면 순수 Python으로 동작하는 대체 구현을 제공
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        numba 미설치 시 사용하는 대체 데코레이터 (원본 함수를 그대로 반환)
+
+        @njit, @njit(cache=True) 두 가지 사용법을 모두 지원
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+def as_f64(values) -> np.ndarray:
+    """
+    Series/배열을 커널 입력용 C 연속 float64 배열로 변환
+
+    이미 float64이고 연속된 데이터면 복사 없이 뷰를 반환하고,
+    dtype 변환이나 비연속 블록이 있을 때만 복사함
+
+    Args:
+        values: pandas Series 또는 배열
+
+    Returns:
+        ndarray: C 연속 float64 배열
+    """
+    if hasattr(values, 'to_numpy'):
+        arr = values.to_numpy(dtype=np.float64, copy=False)
+    else:
+        arr = np.asarray(values, dtype=np.float64)
+    return arr if arr.flags.c_contiguous else np.ascontiguousarray(arr)
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE', 'as_f64']
@@ -3,10 +3,10 @@
 config.yaml 파일을 읽어 설정값 제공
 """
 
-import yaml
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class Config:
@@ -17,6 +17,11 @@ class Config:
 
     _instance = None
     _config = None
+    _flat = None
+
+    # 경로별 파싱 결과 캐시: {경로: (수정 시각(ns), 설정 트리)}
+    # 캐시된 트리는 직접 노출하지 않고 load_config에서 복사본을 사용
+    _cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
 
     def __new__(cls):
         """싱글톤 패턴 구현"""
@@ -47,13 +52,60 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self._config = yaml.safe_load(f)
+        # 파일이 바뀌지 않았으면 이전 파싱 결과를 재사용 (YAML 파싱만 생략하고,
+        # 인스턴스에는 복사본을 주어 수정이 캐시된 트리로 번지지 않게 함)
+        config_path = config_path.resolve()
+        mtime = config_path.stat().st_mtime_ns
+        cached = Config._cache.get(config_path)
+
+        if cached is None or cached[0] != mtime:
+            # yaml은 실제로 파일을 읽을 때만 import (모듈 import 비용 절감)
+            import yaml
+
+            with open(config_path, 'r', encoding='utf-8') as f:
+                tree = yaml.safe_load(f)
+            cached = (mtime, tree)
+            Config._cache[config_path] = cached
+
+        self._config = copy.deepcopy(cached[1])
+        self._flat = self._flatten(self._config)
+
+    @staticmethod
+    def _flatten(tree: Any, prefix: str = '') -> Dict[str, Any]:
+        """
+        설정 트리의 모든 경로를 점 표기 키로 평탄화
+
+        하위 트리 경로도 포함하므로 get('data')는 기존처럼 하위 트리를 반환함
+        (get이 복사본을 돌려주므로 평탄화 결과와 트리가 어긋나지 않음).
+        점이 들어간 키나 문자열이 아닌 키는 점 표기법으로 찾을 수 없으므로 제외
+
+        Args:
+            tree: 설정 트리
+            prefix: 상위 키 경로
+
+        Returns:
+            dict: {'data': {...}, 'data.default_symbol': 'TQQQ', ...}
+        """
+        flat = {}
+        if not isinstance(tree, dict):
+            return flat
+
+        for key, value in tree.items():
+            if not isinstance(key, str) or '.' in key:
+                continue
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(Config._flatten(value, f"{path}."))
+        return flat
 
     def get(self, key: str, default: Any = None) -> Any:
         """
         설정값 가져오기 (점 표기법 지원)
 
+        딕셔너리/리스트 값은 복사본을 반환하므로, 반환값을 수정해도
+        이후 get('data')와 get('data.default_symbol') 결과는 항상 같은 설정을 가리킴
+
         Args:
             key: 설정 키 (예: 'data.default_symbol', 'backtest.initial_capital')
             default: 기본값 (키가 없을 때 반환)
@@ -71,16 +123,15 @@ class Config:
         if self._config is None:
             self.load_config()
 
-        keys = key.split('.')
-        value = self._config
-
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
+        # 하위 트리(예: 'data')를 포함한 모든 경로가 평탄화되어 있으므로 한 번의 조회로 충분
+        if key not in self._flat:
             return default
 
+        value = self._flat[key]
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
     def get_data_config(self) -> Dict[str, Any]:
         """데이터 수집 설정 가져오기"""
         return self.get('data', {})
@@ -143,14 +194,16 @@ class Config:
         return self.get('risk', {})
 
     def get_all(self) -> Dict[str, Any]:
-        """전체 설정 가져오기"""
+        """전체 설정 가져오기 (복사본)"""
         if self._config is None:
             self.load_config()
-        return self._config.copy()
+        return copy.deepcopy(self._config)
 
     def reload(self):
         """설정 파일 다시 로드"""
+        Config._cache.clear()
         self._config = None
+        self._flat = None
         self.load_config()
 
     def __repr__(self):
@@ -3,9 +3,98 @@
 pandas-ta를 기반으로 다양한 기술적 지표 제공
 """
 
+import os
+
 import pandas as pd
 import numpy as np
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+from ._indicator_cache import (
+    rolling_mean_std, macd_lines, rolling_max, rolling_min, span_alphas, clear_cache
+)
+from ._indicator_kernels import _ema, _rsi_wilder, _atr_wilder, _adx_wilder, _compensated_cumsum
+from ._njit import NUMBA_AVAILABLE, as_f64
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:  # pragma: no cover - TA-Lib 미설치 환경
+    talib = None
+    TALIB_AVAILABLE = False
+
+# SMA에 talib.SMA 사용 여부 (환경 변수 USE_TALIB=1로 켬)
+# talib.SMA는 보정 없는 누적합이라 pandas rolling 평균과 ulp 단위로 달라질 수 있으므로,
+# 설치 여부에 따라 기본 결과가 바뀌지 않도록 기본값은 꺼짐
+USE_TALIB = TALIB_AVAILABLE and os.environ.get('USE_TALIB') == '1'
+
+# pandas rolling 집계에 numba 엔진 사용 여부 (환경 변수 USE_NUMBA_ROLLING=1로 켬)
+# 결과는 기본(Cython) 엔진과 동일하지만 프로세스마다 첫 호출 시 JIT 컴파일 비용이 있어 기본값은 꺼짐
+USE_NUMBA_ROLLING = NUMBA_AVAILABLE and os.environ.get('USE_NUMBA_ROLLING') == '1'
+
+# 이보다 짧은 데이터는 numba 엔진을 쓰지 않음
+NUMBA_ROLLING_MIN_ROWS = 1000
+
+_NUMBA_ROLLING_KWARGS = {
+    'engine': 'numba',
+    'engine_kwargs': {'nopython': True, 'nogil': True, 'parallel': True}
+}
+
+
+def _rolling_mean(data, window: int):
+    """
+    이동평균 (pandas rolling(window).mean())
+
+    USE_NUMBA_ROLLING이 켜져 있고 데이터가 충분히 길면 pandas의 numba 엔진을 사용
+
+    Args:
+        data: Series 또는 DataFrame
+        window: 이동 기간
+
+    Returns:
+        Series 또는 DataFrame: 이동평균
+    """
+    rolling = data.rolling(window=window)
+    if USE_NUMBA_ROLLING and len(data) >= NUMBA_ROLLING_MIN_ROWS:
+        return rolling.mean(**_NUMBA_ROLLING_KWARGS)
+    return rolling.mean()
+
+
+def _check_smoothing(smoothing: str) -> None:
+    """
+    평활 방식 인자 검증
+
+    Args:
+        smoothing: 'sma' 또는 'wilder'
+
+    Raises:
+        ValueError: 지원하지 않는 평활 방식
+    """
+    if smoothing not in ('sma', 'wilder'):
+        raise ValueError(f"Unknown smoothing: {smoothing!r} (expected 'sma' or 'wilder')")
+
+
+def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    """
+    True Range = max(고가 - 저가, |고가 - 전일 종가|, |저가 - 전일 종가|)
+
+    NaN은 건너뛰고 최댓값을 취함 (pandas concat(...).max(axis=1)과 동일)
+
+    Args:
+        high: 고가 데이터
+        low: 저가 데이터
+        close: 종가 데이터
+
+    Returns:
+        ndarray: True Range 배열
+    """
+    high, low, close = as_f64(high), as_f64(low), as_f64(close)
+    prev_close = np.full(close.shape, np.nan)
+    prev_close[1:] = close[:-1]
+
+    return np.fmax(
+        np.fmax(high - low, np.abs(high - prev_close)),
+        np.abs(low - prev_close)
+    )
 
 
 class TechnicalIndicators:
@@ -16,6 +105,9 @@ class TechnicalIndicators:
         """
         단순 이동평균 (Simple Moving Average)
 
+        USE_TALIB이 켜져 있고 NaN이 없으면 talib.SMA를 사용하고,
+        그 외에는 pandas rolling을 사용 (TA-Lib은 중간 NaN 이후를 모두 NaN으로 만듦)
+
         Args:
             data: 가격 데이터
             period: 이동평균 기간
@@ -23,7 +115,14 @@ class TechnicalIndicators:
         Returns:
             Series: SMA 값
         """
-        return data.rolling(window=period).mean()
+        if USE_TALIB and period >= 2:
+            values = as_f64(data)
+            if not np.isnan(values).any():
+                return pd.Series(
+                    talib.SMA(values, timeperiod=period), index=data.index, name=data.name
+                )
+
+        return _rolling_mean(data, period)
 
     @staticmethod
     def calculate_ema(data: pd.Series, period: int = 20) -> pd.Series:
@@ -31,41 +130,108 @@ class TechnicalIndicators:
         지수 이동평균 (Exponential Moving Average)
 
         Args:
-            data: 가격 데이터
+            data: 가격 데이터 (DataFrame이면 열마다 계산)
             period: 이동평균 기간
 
         Returns:
             Series: EMA 값
         """
-        return data.ewm(span=period, adjust=False).mean()
+        return TechnicalIndicators.calculate_emas(data, [period])[0]
 
     @staticmethod
-    def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_emas(data: pd.Series, periods: Sequence[int]) -> List[pd.Series]:
+        """
+        여러 기간의 지수 이동평균을 한 번에 계산
+
+        numba가 설치되어 있고 NaN이 없으면 가격 배열을 한 번만 읽는 numba 커널로
+        모든 기간을 계산하고, 그 외에는 pandas ewm을 사용 (두 경로의 결과는 동일)
+
+        Args:
+            data: 가격 데이터 (DataFrame이면 열마다 계산)
+            periods: 이동평균 기간 목록
+
+        Returns:
+            list: 기간 순서대로의 EMA Series 목록 (DataFrame 입력이면 DataFrame 목록)
+        """
+        if isinstance(data, pd.DataFrame):
+            # numba 커널은 1차원 전용이므로 열마다 계산한 뒤 기간별로 모음
+            per_column = {
+                column: TechnicalIndicators.calculate_emas(data[column], periods)
+                for column in data.columns
+            }
+            return [
+                pd.DataFrame(
+                    {column: emas[i] for column, emas in per_column.items()},
+                    index=data.index, columns=data.columns
+                )
+                for i in range(len(periods))
+            ]
+
+        values = as_f64(data)
+
+        if not NUMBA_AVAILABLE or np.isnan(values).any():
+            return [data.ewm(span=period, adjust=False).mean() for period in periods]
+
+        # pandas와 같은 방식으로 span -> alpha 변환
+        emas = _ema(values, span_alphas(periods))
+
+        return [
+            pd.Series(ema, index=data.index, name=data.name) for ema in emas
+        ]
+
+    @staticmethod
+    def calculate_rsi(data: pd.Series, period: int = 14, smoothing: str = 'sma') -> pd.Series:
         """
         상대강도지수 (Relative Strength Index)
 
         Args:
-            data: 가격 데이터
+            data: 가격 데이터 (DataFrame이면 열마다 계산)
             period: RSI 기간
+            smoothing: 평균 상승/하락폭 계산 방식
+                       ('sma': 단순 이동평균, 'wilder': Wilder 평활 단일 패스 커널)
 
         Returns:
             Series: RSI 값 (0-100)
         """
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        _check_smoothing(smoothing)
+
+        if smoothing == 'wilder':
+            if isinstance(data, pd.DataFrame):
+                return pd.DataFrame(
+                    {column: _rsi_wilder(as_f64(data[column]), int(period)) for column in data.columns},
+                    index=data.index
+                )
+            return pd.Series(_rsi_wilder(as_f64(data), int(period)), index=data.index)
 
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        # 가격 변화량을 한 번 계산해 상승/하락폭으로 분리 (첫 행 변화량 NaN은 0으로 처리)
+        values = data.to_numpy(dtype=np.float64)
+        delta = np.full(values.shape, np.nan)
+        delta[1:] = values[1:] - values[:-1]
 
-        return rsi
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+
+        if isinstance(data, pd.DataFrame):
+            wrap = lambda arr: pd.DataFrame(arr, index=data.index, columns=data.columns)
+        else:
+            wrap = lambda arr: pd.Series(arr, index=data.index, name=data.name)
+
+        avg_gain = _rolling_mean(wrap(gain), period).to_numpy()
+        avg_loss = _rolling_mean(wrap(loss), period).to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        return wrap(rsi)
 
     @staticmethod
     def calculate_macd(
         data: pd.Series,
         fast: int = 12,
         slow: int = 26,
-        signal: int = 9
+        signal: int = 9,
+        ema_fast: Optional[pd.Series] = None,
+        ema_slow: Optional[pd.Series] = None
     ) -> pd.DataFrame:
         """
         MACD (Moving Average Convergence Divergence)
@@ -75,22 +241,34 @@ class TechnicalIndicators:
             fast: 빠른 EMA 기간
             slow: 느린 EMA 기간
             signal: 시그널 라인 기간
+            ema_fast: 이미 계산한 빠른 EMA (ema_slow와 함께 주면 EMA를 다시 계산하지 않음)
+            ema_slow: 이미 계산한 느린 EMA
 
         Returns:
             DataFrame: MACD, Signal, Histogram
-        """
-        ema_fast = data.ewm(span=fast, adjust=False).mean()
-        ema_slow = data.ewm(span=slow, adjust=False).mean()
 
-        macd = ema_fast - ema_slow
-        signal_line = macd.ewm(span=signal, adjust=False).mean()
-        histogram = macd - signal_line
+        Raises:
+            ValueError: ema_fast와 ema_slow 중 하나만 주어진 경우
+        """
+        if (ema_fast is None) != (ema_slow is None):
+            raise ValueError("ema_fast and ema_slow must be given together")
+
+        if ema_fast is not None:
+            macd = as_f64(ema_fast) - as_f64(ema_slow)
+            signal_line = as_f64(
+                TechnicalIndicators.calculate_ema(pd.Series(macd), signal)
+            )
+            histogram = macd - signal_line
+        else:
+            macd, signal_line, histogram = macd_lines(
+                as_f64(data), fast, slow, signal
+            )
 
         return pd.DataFrame({
             'MACD': macd,
             'Signal': signal_line,
             'Histogram': histogram
-        })
+        }, index=data.index)
 
     @staticmethod
     def calculate_bollinger_bands(
@@ -109,8 +287,8 @@ class TechnicalIndicators:
         Returns:
             DataFrame: Upper, Middle, Lower 밴드
         """
-        middle = data.rolling(window=period).mean()
-        std = data.rolling(window=period).std()
+        # 이동평균/표준편차는 ZScore 전략 등과 캐시를 공유
+        middle, std = rolling_mean_std(as_f64(data), period)
 
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
@@ -119,14 +297,15 @@ class TechnicalIndicators:
             'BB_Upper': upper,
             'BB_Middle': middle,
             'BB_Lower': lower
-        })
+        }, index=data.index)
 
     @staticmethod
     def calculate_atr(
         high: pd.Series,
         low: pd.Series,
         close: pd.Series,
-        period: int = 14
+        period: int = 14,
+        smoothing: str = 'sma'
     ) -> pd.Series:
         """
         평균 진폭 범위 (Average True Range)
@@ -136,16 +315,22 @@ class TechnicalIndicators:
             low: 저가 데이터
             close: 종가 데이터
             period: ATR 기간
+            smoothing: True Range 평균 방식
+                       ('sma': 단순 이동평균, 'wilder': Wilder 평활 단일 패스 커널)
 
         Returns:
             Series: ATR 값
         """
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
+        _check_smoothing(smoothing)
+
+        if smoothing == 'wilder':
+            return pd.Series(
+                _atr_wilder(as_f64(high), as_f64(low), as_f64(close), int(period)),
+                index=close.index
+            )
 
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
+        tr = pd.Series(_true_range(high, low, close), index=close.index)
+        atr = _rolling_mean(tr, period)
 
         return atr
 
@@ -170,11 +355,16 @@ class TechnicalIndicators:
         Returns:
             DataFrame: %K, %D
         """
-        lowest_low = low.rolling(window=k_period).min()
-        highest_high = high.rolling(window=k_period).max()
+        # 최저가/최고가는 단조 덱 커널로 계산 (pandas rolling과 결과 동일)
+        lowest_low = rolling_min(as_f64(low), k_period, k_period)
+        highest_high = rolling_max(as_f64(high), k_period, k_period)
 
-        k = 100 * (close - lowest_low) / (highest_high - lowest_low)
-        d = k.rolling(window=d_period).mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = pd.Series(
+                100 * (as_f64(close) - lowest_low) / (highest_high - lowest_low),
+                index=close.index
+            )
+        d = _rolling_mean(k, d_period)
 
         return pd.DataFrame({
             'Stoch_K': k,
@@ -186,7 +376,8 @@ class TechnicalIndicators:
         high: pd.Series,
         low: pd.Series,
         close: pd.Series,
-        period: int = 14
+        period: int = 14,
+        smoothing: str = 'sma'
     ) -> pd.Series:
         """
         평균 방향성 지수 (Average Directional Index)
@@ -196,30 +387,44 @@ class TechnicalIndicators:
             low: 저가 데이터
             close: 종가 데이터
             period: ADX 기간
+            smoothing: TR/DM/DX 평균 방식
+                       ('sma': 단순 이동평균, 'wilder': Wilder 정의의 DM과 평활을 쓰는 단일 패스 커널)
 
         Returns:
             Series: ADX 값
         """
-        plus_dm = high.diff()
-        minus_dm = -low.diff()
+        _check_smoothing(smoothing)
+
+        if smoothing == 'wilder':
+            return pd.Series(
+                _adx_wilder(as_f64(high), as_f64(low), as_f64(close), int(period)),
+                index=close.index
+            )
+
+        def rolling_mean(values: np.ndarray) -> np.ndarray:
+            return _rolling_mean(pd.Series(values), period).to_numpy()
+
+        high_values = as_f64(high)
+        low_values = as_f64(low)
+
+        # 방향성 움직임 (음수는 0, 첫 행은 NaN)
+        plus_dm = np.full(high_values.shape, np.nan)
+        minus_dm = np.full(low_values.shape, np.nan)
+        plus_dm[1:] = high_values[1:] - high_values[:-1]
+        minus_dm[1:] = -(low_values[1:] - low_values[:-1])
 
         plus_dm[plus_dm < 0] = 0
         minus_dm[minus_dm < 0] = 0
 
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        atr = rolling_mean(_true_range(high, low, close))
 
-        atr = tr.rolling(window=period).mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = 100 * (rolling_mean(plus_dm) / atr)
+            minus_di = 100 * (rolling_mean(minus_dm) / atr)
 
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
 
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
-
-        return adx
+        return pd.Series(rolling_mean(dx), index=close.index)
 
     @staticmethod
     def calculate_obv(close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -233,8 +438,19 @@ class TechnicalIndicators:
         Returns:
             Series: OBV 값
         """
-        obv = (np.sign(close.diff()) * volume).fillna(0).cumsum()
-        return obv
+        close_values = as_f64(close)
+
+        # 전일 대비 방향 (+1 / -1 / 0), NaN 비교는 0
+        direction = np.zeros(close_values.shape, dtype=np.int8)
+        direction[1:] = (
+            (close_values[1:] > close_values[:-1]).view(np.int8)
+            - (close_values[1:] < close_values[:-1]).view(np.int8)
+        )
+
+        flow = direction * as_f64(volume)
+        flow[np.isnan(flow)] = 0.0
+
+        return pd.Series(np.cumsum(flow), index=close.index)
 
     @staticmethod
     def calculate_vwap(
@@ -246,6 +462,9 @@ class TechnicalIndicators:
         """
         거래량 가중 평균 가격 (Volume Weighted Average Price)
 
+        분자/분모 누적합은 보정 합산 커널로 계산하여 긴 기간에서도 반올림 오차가
+        누적되지 않음
+
         Args:
             high: 고가 데이터
             low: 저가 데이터
@@ -255,58 +474,107 @@ class TechnicalIndicators:
         Returns:
             Series: VWAP 값
         """
-        typical_price = (high + low + close) / 3
-        vwap = (typical_price * volume).cumsum() / volume.cumsum()
+        volume_values = as_f64(volume)
+        typical_price = (as_f64(high) + as_f64(low) + as_f64(close)) / 3
+
+        cum_value = _compensated_cumsum(typical_price * volume_values)
+        cum_volume = _compensated_cumsum(volume_values)
 
-        return vwap
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vwap = cum_value / cum_volume
+
+        return pd.Series(vwap, index=close.index)
 
     @staticmethod
-    def add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    def add_all_indicators(df: pd.DataFrame, dtype=np.float64) -> pd.DataFrame:
         """
         모든 주요 지표를 데이터프레임에 추가
 
         Args:
             df: OHLCV 데이터프레임
+            dtype: 지표 컬럼 dtype (np.float32로 주면 메모리 절반, 계산은 float64로 하고 마지막에 변환)
+                   OBV는 누적 거래량이 float32 정수 정밀도(2^24)를 쉽게 넘으므로 항상 float64 유지
 
         Returns:
             DataFrame: 지표가 추가된 데이터프레임
         """
-        df = df.copy()
-
-        # 이동평균
-        df['SMA_20'] = TechnicalIndicators.calculate_sma(df['Close'], 20)
-        df['SMA_50'] = TechnicalIndicators.calculate_sma(df['Close'], 50)
-        df['EMA_12'] = TechnicalIndicators.calculate_ema(df['Close'], 12)
-        df['EMA_26'] = TechnicalIndicators.calculate_ema(df['Close'], 26)
+        # 원본을 복사하지 않고 지표 컬럼만 하나의 딕셔너리로 모아서 마지막에 한 번 concat
+        # OHLCV 컬럼을 한 번만 연속 float64로 변환 (이후 지표 내부의 as_f64는 복사 없이 뷰 반환)
+        close, high, low, volume = (
+            pd.Series(as_f64(df[column]), index=df.index, name=column)
+            for column in ('Close', 'High', 'Low', 'Volume')
+        )
 
-        # RSI
-        df['RSI'] = TechnicalIndicators.calculate_rsi(df['Close'])
+        # EMA 12/26은 가격 배열 한 번 순회로 계산하고 MACD에서 재사용
+        ema_12, ema_26 = TechnicalIndicators.calculate_emas(close, [12, 26])
+        macd_df = TechnicalIndicators.calculate_macd(close, ema_fast=ema_12, ema_slow=ema_26)
+        bb_df = TechnicalIndicators.calculate_bollinger_bands(close)
+        stoch_df = TechnicalIndicators.calculate_stochastic(high, low, close)
+
+        columns = {
+            # 이동평균, RSI
+            'SMA_20': TechnicalIndicators.calculate_sma(close, 20),
+            'SMA_50': TechnicalIndicators.calculate_sma(close, 50),
+            'EMA_12': ema_12,
+            'EMA_26': ema_26,
+            'RSI': TechnicalIndicators.calculate_rsi(close),
+            # MACD, 볼린저 밴드
+            **{name: macd_df[name] for name in macd_df.columns},
+            **{name: bb_df[name] for name in bb_df.columns},
+            # ATR, 스토캐스틱
+            'ATR': TechnicalIndicators.calculate_atr(high, low, close),
+            **{name: stoch_df[name] for name in stoch_df.columns},
+            # OBV, VWAP
+            'OBV': TechnicalIndicators.calculate_obv(close, volume),
+            'VWAP': TechnicalIndicators.calculate_vwap(high, low, close, volume)
+        }
+
+        indicators = pd.DataFrame(columns, index=df.index)
+        if np.dtype(dtype) != np.float64:
+            indicators = indicators.astype(
+                {name: dtype for name in indicators.columns if name != 'OBV'}
+            )
+
+        return pd.concat([df, indicators], axis=1)
 
-        # MACD
-        macd_df = TechnicalIndicators.calculate_macd(df['Close'])
-        df = pd.concat([df, macd_df], axis=1)
+    @staticmethod
+    def add_all_indicators_batch(
+        dfs: Dict[str, pd.DataFrame],
+        max_workers: Optional[int] = None,
+        dtype=np.float64
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목의 데이터프레임에 모든 주요 지표를 병렬로 추가
 
-        # 볼린저 밴드
-        bb_df = TechnicalIndicators.calculate_bollinger_bands(df['Close'])
-        df = pd.concat([df, bb_df], axis=1)
+        스레드 풀에서 종목별로 add_all_indicators를 호출함 (전략의
+        generate_signals_parallel과 같은 방식). numba 커널은 GIL을 해제(nogil)하므로
+        커널 구간은 여러 코어에서 동시에 실행되고, 프로세스 풀과 달리 데이터프레임을
+        직렬화하지 않으며 지표 캐시도 공유함
 
-        # ATR
-        df['ATR'] = TechnicalIndicators.calculate_atr(
-            df['High'], df['Low'], df['Close']
-        )
+        Args:
+            dfs: {종목: OHLCV 데이터프레임} 딕셔너리
+            max_workers: 최대 스레드 수 (None이면 기본값)
+            dtype: 지표 컬럼 dtype (add_all_indicators와 동일)
 
-        # 스토캐스틱
-        stoch_df = TechnicalIndicators.calculate_stochastic(
-            df['High'], df['Low'], df['Close']
-        )
-        df = pd.concat([df, stoch_df], axis=1)
+        Returns:
+            dict: {종목: 지표가 추가된 데이터프레임} (입력과 같은 순서)
+        """
+        if not dfs:
+            return {}
 
-        # OBV
-        df['OBV'] = TechnicalIndicators.calculate_obv(df['Close'], df['Volume'])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda df: TechnicalIndicators.add_all_indicators(df, dtype), dfs.values()
+            )
+            return dict(zip(dfs.keys(), results))
 
-        # VWAP
-        df['VWAP'] = TechnicalIndicators.calculate_vwap(
-            df['High'], df['Low'], df['Close'], df['Volume']
-        )
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        지표 캐시 비우기
 
-        return df
+        전략/지표가 공유하는 지표 캐시(결과 수 CACHE_SIZE, 총 CACHE_MAX_BYTES까지 보관)를
+        비움. 대량 종목의 generate_signals_parallel / sweep / Backtester.run 이후
+        입력 데이터와 함께 메모리를 바로 해제하려면 호출
+        """
+        clear_cache()
@@ -1,15 +1,25 @@
 """
 시각화 모듈
 matplotlib, seaborn, plotly를 활용한 차트 생성
+
+차트 라이브러리는 import 시간이 길어 (src.utils를 import하는 백테스트에서도
+매번 비용이 발생) 실제로 그리는 메서드 안에서 import함
 """
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Optional, List, Tuple
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from typing import TYPE_CHECKING, Optional, List, Tuple
+
+if TYPE_CHECKING:
+    from matplotlib.collections import PolyCollection
+
+
+# 선 차트를 솎아서 그리기 시작하는 데이터 길이와 솎은 뒤의 최대 점 수
+LINE_DECIMATE_THRESHOLD = 50000
+LINE_MAX_POINTS = 4000
+
+# 캔들스틱 차트를 WebGL 트레이스와 캔들 묶기로 그리기 시작하는 캔들 수 (묶은 뒤 최대 캔들 수)
+CANDLE_WEBGL_THRESHOLD = 20000
 
 
 class Visualizer:
@@ -22,6 +32,9 @@ class Visualizer:
         Args:
             style: matplotlib 스타일
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         try:
             plt.style.use(style)
         except:
@@ -43,22 +56,27 @@ class Visualizer:
             title: 차트 제목
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize, sharex=True)
 
         # 가격 차트
-        ax1.plot(df.index, df['Close'], label='Close', linewidth=2)
+        ax1.plot(*Visualizer._line_points(df.index, df['Close']), label='Close', linewidth=2)
         if 'SMA_20' in df.columns:
-            ax1.plot(df.index, df['SMA_20'], label='SMA 20', alpha=0.7)
+            ax1.plot(*Visualizer._line_points(df.index, df['SMA_20']), label='SMA 20', alpha=0.7)
         if 'SMA_50' in df.columns:
-            ax1.plot(df.index, df['SMA_50'], label='SMA 50', alpha=0.7)
+            ax1.plot(*Visualizer._line_points(df.index, df['SMA_50']), label='SMA 50', alpha=0.7)
 
         ax1.set_ylabel('Price ($)')
         ax1.set_title(title)
         ax1.legend()
         ax1.grid(True, alpha=0.3)
 
-        # 거래량 차트
-        ax2.bar(df.index, df['Volume'], alpha=0.5)
+        # 거래량 차트 (막대마다 Artist를 만들지 않도록 하나의 PolyCollection으로 그림)
+        ax2.add_collection(
+            Visualizer._bar_collection(df.index, df['Volume'], facecolor='C0', alpha=0.5)
+        )
+        ax2.autoscale_view()
         ax2.set_ylabel('Volume')
         ax2.set_xlabel('Date')
         ax2.grid(True, alpha=0.3)
@@ -66,11 +84,131 @@ class Visualizer:
         plt.tight_layout()
         plt.show()
 
+    @staticmethod
+    def _line_points(x: pd.Index, values: pd.Series) -> Tuple[pd.Index, np.ndarray]:
+        """
+        긴 선 차트를 구간별 최솟값/최댓값 점만 남겨 솎아냄
+
+        점이 LINE_DECIMATE_THRESHOLD개를 넘으면 데이터를 LINE_MAX_POINTS / 2개 구간으로
+        나누고 구간마다 최솟값과 최댓값 위치만 시간 순서대로 남김. 화면 픽셀보다
+        훨씬 많은 점을 그리지 않으면서 급등락 같은 극값과 선의 외곽은 그대로 유지됨.
+        NaN만 있는 구간은 NaN 점이 남아 선이 끊어짐
+
+        Args:
+            x: x축 값 (날짜 또는 숫자 인덱스)
+            values: y축 값
+
+        Returns:
+            tuple: (x, y) 그릴 점
+        """
+        y = np.asarray(values, dtype=np.float64)
+        n = y.shape[0]
+        if n <= LINE_DECIMATE_THRESHOLD:
+            return x, y
+
+        # 구간 크기를 맞추기 위해 끝을 NaN으로 채운 (구간 수, 구간 크기) 행렬
+        buckets = LINE_MAX_POINTS // 2
+        size = -(-n // buckets)
+        padded = np.full(buckets * size, np.nan)
+        padded[:n] = y
+        padded = padded.reshape(buckets, size)
+
+        nan_mask = np.isnan(padded)
+        lo = np.where(nan_mask, np.inf, padded).argmin(axis=1)
+        hi = np.where(nan_mask, -np.inf, padded).argmax(axis=1)
+
+        # 구간 안에서 시간 순서 유지
+        offsets = np.arange(buckets)[:, None] * size
+        positions = (np.sort(np.stack([lo, hi], axis=1), axis=1) + offsets).ravel()
+        positions = positions[positions < n]
+
+        return x[positions], y[positions]
+
+    @staticmethod
+    def _bar_collection(
+        x: pd.Index,
+        heights: pd.Series,
+        width: float = 0.8,
+        **kwargs
+    ) -> "PolyCollection":
+        """
+        막대 차트를 하나의 PolyCollection으로 생성
+
+        ax.bar는 막대마다 Rectangle Artist를 만들어 막대 수가 많으면 느려지므로,
+        모든 막대를 (N, 4, 2) 꼭짓점 배열 하나로 그림. 막대 폭은 ax.bar 기본값과 같음
+        (날짜 축이면 일 단위)
+
+        Args:
+            x: 막대 위치 (날짜 또는 숫자 인덱스)
+            heights: 막대 높이
+            width: 막대 폭
+            **kwargs: PolyCollection 스타일 인자
+
+        Returns:
+            PolyCollection: 막대 컬렉션
+        """
+        import matplotlib.dates as mdates
+        from matplotlib.collections import PolyCollection
+
+        if isinstance(x, pd.DatetimeIndex):
+            centers = mdates.date2num(x)
+        else:
+            centers = np.asarray(x, dtype=np.float64)
+        heights = np.asarray(heights, dtype=np.float64)
+
+        left = centers - width / 2
+        right = centers + width / 2
+        base = np.zeros_like(heights)
+
+        verts = np.stack([
+            np.column_stack([left, base]),
+            np.column_stack([left, heights]),
+            np.column_stack([right, heights]),
+            np.column_stack([right, base])
+        ], axis=1)
+
+        collection = PolyCollection(verts, **kwargs)
+        # ax.bar와 같이 자동 축 범위가 0 아래로 여백을 두지 않도록 고정
+        collection.sticky_edges.y.append(0)
+
+        return collection
+
+    @staticmethod
+    def _aggregate_candles(df: pd.DataFrame, max_candles: int) -> pd.DataFrame:
+        """
+        연속된 캔들을 묶어 캔들 수를 max_candles 이하로 줄임
+
+        ceil(행 수 / max_candles)개 행마다 시가는 첫 값, 고가는 최댓값, 저가는 최솟값,
+        종가는 마지막 값, 거래량은 합계로 집계 (Volume 컬럼이 있을 때만). 날짜 간격과
+        무관하게 행 위치로 묶으며 각 캔들의 x 위치는 묶음의 첫 인덱스
+
+        Args:
+            df: OHLCV 데이터프레임
+            max_candles: 최대 캔들 수
+
+        Returns:
+            DataFrame: 집계된 OHLCV 데이터프레임
+        """
+        step = -(-len(df) // max_candles)
+        if step <= 1:
+            return df
+
+        how = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
+        if 'Volume' in df.columns:
+            how['Volume'] = 'sum'
+
+        groups = np.arange(len(df)) // step
+        aggregated = df.groupby(groups).agg(how)
+        aggregated.index = df.index[::step]
+
+        return aggregated
+
     @staticmethod
     def plot_candlestick(
         df: pd.DataFrame,
         title: str = "Candlestick Chart",
-        show_volume: bool = True
+        show_volume: bool = True,
+        webgl: Optional[bool] = None
     ) -> None:
         """
         캔들스틱 차트 (plotly 사용)
@@ -79,7 +217,18 @@ class Visualizer:
             df: OHLCV 데이터프레임
             title: 차트 제목
             show_volume: 거래량 표시 여부
+            webgl: 대용량 모드 사용 여부 (None이면 캔들이 CANDLE_WEBGL_THRESHOLD개를
+                   넘을 때 자동 사용). 캔들을 CANDLE_WEBGL_THRESHOLD개 이하로 묶고
+                   거래량은 SVG 막대 대신 WebGL(Scattergl) 영역 차트로 그림
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
+        if webgl is None:
+            webgl = len(df) > CANDLE_WEBGL_THRESHOLD
+        if webgl:
+            df = Visualizer._aggregate_candles(df, CANDLE_WEBGL_THRESHOLD)
+
         if show_volume:
             fig = make_subplots(
                 rows=2, cols=1,
@@ -102,10 +251,13 @@ class Visualizer:
             )
 
             # 거래량
-            fig.add_trace(
-                go.Bar(x=df.index, y=df['Volume'], name='Volume'),
-                row=2, col=1
-            )
+            if webgl:
+                volume_trace = go.Scattergl(
+                    x=df.index, y=df['Volume'], name='Volume', mode='lines', fill='tozeroy'
+                )
+            else:
+                volume_trace = go.Bar(x=df.index, y=df['Volume'], name='Volume')
+            fig.add_trace(volume_trace, row=2, col=1)
 
             fig.update_layout(
                 title=title,
@@ -140,6 +292,8 @@ class Visualizer:
             df: 수익률이 포함된 데이터프레임
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+
         if 'Returns' not in df.columns:
             df['Returns'] = df['Close'].pct_change()
 
@@ -174,11 +328,16 @@ class Visualizer:
             title: 차트 제목
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+
         fig, axes = plt.subplots(3, 1, figsize=figsize, sharex=True)
 
         # 포트폴리오 가치
         if 'Portfolio_Value' in df.columns:
-            axes[0].plot(df.index, df['Portfolio_Value'], label='Portfolio Value', linewidth=2)
+            axes[0].plot(
+                *Visualizer._line_points(df.index, df['Portfolio_Value']),
+                label='Portfolio Value', linewidth=2
+            )
             axes[0].set_ylabel('Portfolio Value ($)')
             axes[0].set_title(title)
             axes[0].legend()
@@ -186,7 +345,10 @@ class Visualizer:
 
         # 수익률
         if 'Strategy_Returns' in df.columns:
-            axes[1].plot(df.index, df['Strategy_Returns'].cumsum(), label='Cumulative Returns', linewidth=2)
+            axes[1].plot(
+                *Visualizer._line_points(df.index, df['Strategy_Returns'].cumsum()),
+                label='Cumulative Returns', linewidth=2
+            )
             axes[1].axhline(0, color='red', linestyle='--', alpha=0.5)
             axes[1].set_ylabel('Cumulative Returns')
             axes[1].legend()
@@ -219,6 +381,8 @@ class Visualizer:
             price: 가격도 함께 표시할지 여부
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+
         if indicator_name not in df.columns:
             raise ValueError(f"{indicator_name} not found in dataframe")
 
@@ -226,20 +390,23 @@ class Visualizer:
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize, sharex=True)
 
             # 가격
-            ax1.plot(df.index, df['Close'], label='Close Price', linewidth=2)
+            ax1.plot(*Visualizer._line_points(df.index, df['Close']), label='Close Price', linewidth=2)
             ax1.set_ylabel('Price ($)')
             ax1.legend()
             ax1.grid(True, alpha=0.3)
 
             # 지표
-            ax2.plot(df.index, df[indicator_name], label=indicator_name, linewidth=2, color='orange')
+            ax2.plot(
+                *Visualizer._line_points(df.index, df[indicator_name]),
+                label=indicator_name, linewidth=2, color='orange'
+            )
             ax2.set_ylabel(indicator_name)
             ax2.set_xlabel('Date')
             ax2.legend()
             ax2.grid(True, alpha=0.3)
         else:
             fig, ax = plt.subplots(figsize=figsize)
-            ax.plot(df.index, df[indicator_name], label=indicator_name, linewidth=2)
+            ax.plot(*Visualizer._line_points(df.index, df[indicator_name]), label=indicator_name, linewidth=2)
             ax.set_ylabel(indicator_name)
             ax.set_xlabel('Date')
             ax.legend()
@@ -262,6 +429,9 @@ class Visualizer:
             columns: 분석할 컬럼 리스트 (None이면 숫자 컬럼 전체)
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         if columns:
             corr = df[columns].corr()
         else:
@@ -297,14 +467,16 @@ class Visualizer:
             normalize: 정규화 여부 (시작점을 100으로)
             figsize: 그림 크기
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=figsize)
 
         for symbol, df in data_dict.items():
+            # 종목마다 기간/길이가 다를 수 있으므로 Series 대신 원시 배열로 정규화
+            close = df['Close'].to_numpy()
             if normalize:
-                normalized = (df['Close'] / df['Close'].iloc[0]) * 100
-                plt.plot(df.index, normalized, label=symbol, linewidth=2)
-            else:
-                plt.plot(df.index, df['Close'], label=symbol, linewidth=2)
+                close = (close / close[0]) * 100
+            plt.plot(df.index, close, label=symbol, linewidth=2)
 
         plt.ylabel('Normalized Price' if normalize else 'Price ($)')
         plt.xlabel('Date')